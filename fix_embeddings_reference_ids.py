@@ -25,6 +25,9 @@ logger = logging.getLogger("fix_embeddings")
 # Load environment variables
 load_dotenv()
 
+# Embeddings updated between progress log lines
+PROGRESS_LOG_INTERVAL = 1000
+
 # Database connection parameters
 DB_HOST = os.getenv('SUPABASE_DB_HOST', 'aws-0-us-east-1.pooler.supabase.com')
 DB_PORT = os.getenv('SUPABASE_DB_PORT', '5432')
@@ -70,7 +73,7 @@ async def get_all_embeddings(conn):
         ref_id = row['reference_id']
         if ref_id and simple_frame_pattern.match(ref_id):
             invalid_embeddings.append(row)
-            logger.info(f"Found invalid embedding: {row['embedding_id']} with reference_id '{ref_id}'")
+            logger.debug(f"Found invalid embedding: {row['embedding_id']} with reference_id '{ref_id}'")
     
     logger.info(f"Manually identified {len(invalid_embeddings)} embeddings with old format reference IDs")
     return invalid_embeddings
@@ -100,6 +103,19 @@ async def update_embedding_references(conn, invalid_embeddings):
     
     logger.info(f"Using folder name: {folder_name}")
     
+    # Prepare the per-row lookup and update once so the loop doesn't
+    # re-parse and re-plan the same SQL for every embedding
+    lookup_stmt = await conn.prepare("""
+        SELECT reference_id 
+        FROM metadata.frame_details_chunks 
+        WHERE chunk_id = $1
+    """)
+    update_stmt = await conn.prepare("""
+        UPDATE embeddings.multimodal_embeddings_chunks
+        SET reference_id = $1
+        WHERE embedding_id = $2
+    """)
+    
     # Update each embedding
     updated_count = 0
     for row in invalid_embeddings:
@@ -108,11 +124,7 @@ async def update_embedding_references(conn, invalid_embeddings):
         old_ref = row['reference_id']
         
         # Try to get the correct reference ID from metadata.frame_details_chunks
-        new_ref = await conn.fetchval("""
-            SELECT reference_id 
-            FROM metadata.frame_details_chunks 
-            WHERE chunk_id = $1
-        """, chunk_id)
+        new_ref = await lookup_stmt.fetchval(chunk_id)
         
         if not new_ref:
             # Fall back to constructing a new reference ID
@@ -120,14 +132,12 @@ async def update_embedding_references(conn, invalid_embeddings):
             new_ref = f"{folder_name}/{frame_id}_Chunk1"
         
         # Execute the update
-        await conn.execute("""
-            UPDATE embeddings.multimodal_embeddings_chunks
-            SET reference_id = $1
-            WHERE embedding_id = $2
-        """, new_ref, embedding_id)
+        await update_stmt.fetchval(new_ref, embedding_id)
         
-        logger.info(f"Updated embedding {embedding_id}: '{old_ref}' -> '{new_ref}'")
+        logger.debug(f"Updated embedding {embedding_id}: '{old_ref}' -> '{new_ref}'")
         updated_count += 1
+        if updated_count % PROGRESS_LOG_INTERVAL == 0:
+            logger.info(f"Updated {updated_count}/{len(invalid_embeddings)} embeddings")
     
     return updated_count
 
@@ -8,6 +8,7 @@ rate limits better and distribute load across multiple keys.
 Features:
 - Key rotation for Google Gemini, OpenAI, and other APIs
 - Rate limit tracking and cooldown periods
+- Per-key request rate limits and least-loaded key selection for concurrent requests
 - Error tracking for each key
 - Automatic fallback to working keys
 
@@ -42,26 +43,34 @@ class ApiKeyRotator:
     errors and rate limits.
     """
     
-    def __init__(self, api_keys: List[str]):
+    def __init__(self, api_keys: List[str], rate_limit: Optional[int] = None):
         """
         Initialize the API key rotator.
         
         Args:
             api_keys: List of API keys to rotate between
+            rate_limit: Requests per minute allowed per key by acquire_key, or
+                None for no limit
         """
         self.api_keys = api_keys
         self.key_index = 0
         self.key_stats = {}
         self.lock = Lock()
+        self.rate_limit = rate_limit
         
-        # Initialize stats for each key
+        # Initialize stats for each key; tokens is the key's request budget,
+        # refilled at rate_limit per minute
+        now = time.time()
         for key in self.api_keys:
             self.key_stats[key] = {
                 'use_count': 0,
                 'error_count': 0,
                 'last_used': 0,
                 'cooldown_until': 0,
-                'is_valid': True
+                'is_valid': True,
+                'in_flight': 0,
+                'tokens': float(rate_limit or 0),
+                'tokens_updated': now
             }
         
         logger.info(f"Initialized ApiKeyRotator with {len(api_keys)} keys")
@@ -118,6 +127,83 @@ class ApiKeyRotator:
             logger.error("No valid API keys available")
             return None
     
+    def acquire_key(self, preferred: Optional[str] = None) -> Optional[str]:
+        """
+        Take a request slot on a key for a concurrent request. The preferred
+        key is used while it has budget left under the rate limit; otherwise
+        the least-loaded key with budget is used. If every key is cooling down
+        or out of budget, a key is returned anyway rather than blocking.
+        Release the slot with release_key when the request completes.
+        
+        Args:
+            preferred: Key to keep using if it is available (e.g. the current one)
+            
+        Returns:
+            An API key string or None if no valid keys remain
+        """
+        with self.lock:
+            now = time.time()
+            usable = [key for key in self.api_keys if self.key_stats[key]['is_valid']]
+            if not usable:
+                logger.error("No valid API keys available")
+                return None
+            
+            ready = [
+                key for key in usable
+                if self.key_stats[key]['cooldown_until'] <= now and self._has_budget(self.key_stats[key], now)
+            ]
+            if preferred in ready:
+                key = preferred
+            elif ready:
+                key = min(ready, key=lambda k: (self.key_stats[k]['in_flight'], -self.key_stats[k]['tokens']))
+            elif preferred in usable:
+                key = preferred
+            else:
+                key = min(usable, key=lambda k: self.key_stats[k]['cooldown_until'])
+            
+            stats = self.key_stats[key]
+            stats['in_flight'] += 1
+            stats['use_count'] += 1
+            stats['last_used'] = now
+            if self.rate_limit:
+                stats['tokens'] -= 1
+            return key
+    
+    def release_key(self, api_key: str) -> None:
+        """
+        Release a request slot taken with acquire_key.
+        
+        Args:
+            api_key: The API key the request used
+        """
+        with self.lock:
+            if api_key in self.key_stats:
+                self.key_stats[api_key]['in_flight'] = max(0, self.key_stats[api_key]['in_flight'] - 1)
+    
+    def get_key_for_shard(self, shard: int) -> Optional[str]:
+        """
+        Get a fixed key for one of several concurrent users (e.g. worker
+        processes), so that they start out on different keys.
+        
+        Args:
+            shard: Index of the user
+            
+        Returns:
+            An API key string or None if no valid keys remain
+        """
+        with self.lock:
+            usable = [key for key in self.api_keys if self.key_stats[key]['is_valid']]
+            return usable[shard % len(usable)] if usable else None
+    
+    def _has_budget(self, stats: Dict[str, Any], now: float) -> bool:
+        """Refill a key's request budget and check that a request fits in it."""
+        if not self.rate_limit:
+            return True
+        elapsed = now - stats['tokens_updated']
+        stats['tokens'] = min(float(self.rate_limit), stats['tokens'] + elapsed * self.rate_limit / 60)
+        stats['tokens_updated'] = now
+        return stats['tokens'] >= 1
+    
     def mark_success(self, api_key: str) -> None:
         """
         Mark a successful API call with the given key.
@@ -197,10 +283,8 @@ class GeminiKeyRotator(ApiKeyRotator):
         Args:
             api_keys: List of Gemini API keys
         """
-        super().__init__(api_keys)
-        
         # Gemini-specific settings
-        self.rate_limit = int(os.environ.get("GEMINI_RATE_LIMIT", "60"))  # Requests per minute
+        super().__init__(api_keys, rate_limit=int(os.environ.get("GEMINI_RATE_LIMIT", "60")))  # Requests per minute
         self.cooldown_period = int(os.environ.get("GEMINI_COOLDOWN_PERIOD", "60"))  # Seconds
         
         logger.info(f"Initialized GeminiKeyRotator with rate limit of {self.rate_limit} RPM")
@@ -231,12 +315,13 @@ def initialize_gemini_key_rotation(api_keys: List[str]) -> None:
     with _gemini_rotator_lock:
         _gemini_rotator = GeminiKeyRotator(api_keys)
 
-def get_next_gemini_key() -> Optional[str]:
+def _get_gemini_rotator() -> Optional[GeminiKeyRotator]:
     """
-    Get the next available Gemini API key.
+    Get the global Gemini key rotator, initializing it from the environment
+    on first use.
     
     Returns:
-        A Gemini API key or None if no keys are available
+        The rotator or None if no keys are available
     """
     global _gemini_rotator
     
@@ -268,7 +353,53 @@ def get_next_gemini_key() -> Optional[str]:
                     logger.warning("No Gemini API keys available in environment variables")
                     return None
     
-    return _gemini_rotator.get_next_key()
+    return _gemini_rotator
+
+def get_next_gemini_key() -> Optional[str]:
+    """
+    Get the next available Gemini API key.
+    
+    Returns:
+        A Gemini API key or None if no keys are available
+    """
+    rotator = _get_gemini_rotator()
+    return rotator.get_next_key() if rotator else None
+
+def acquire_gemini_key(preferred: Optional[str] = None) -> Optional[str]:
+    """
+    Take a request slot on a Gemini key (see ApiKeyRotator.acquire_key).
+    
+    Args:
+        preferred: Key to keep using if it has budget left
+        
+    Returns:
+        A Gemini API key or None if no keys are available
+    """
+    rotator = _get_gemini_rotator()
+    return rotator.acquire_key(preferred) if rotator else None
+
+def release_gemini_key(api_key: str) -> None:
+    """
+    Release a request slot taken with acquire_gemini_key.
+    
+    Args:
+        api_key: The Gemini API key the request used
+    """
+    if _gemini_rotator:
+        _gemini_rotator.release_key(api_key)
+
+def get_gemini_key_for_shard(shard: int) -> Optional[str]:
+    """
+    Get a fixed Gemini key for one of several concurrent users.
+    
+    Args:
+        shard: Index of the user (e.g. worker process number)
+        
+    Returns:
+        A Gemini API key or None if no keys are available
+    """
+    rotator = _get_gemini_rotator()
+    return rotator.get_key_for_shard(shard) if rotator else None
 
 def mark_gemini_key_success(api_key: str) -> None:
     """
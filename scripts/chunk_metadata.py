@@ -21,6 +21,7 @@ Options:
 """
 
 import argparse
+import functools
 import json
 import os
 import logging
@@ -167,73 +168,110 @@ def save_chunks_to_csv(chunks: List[Dict[str, Any]], output_dir: str) -> None:
         logger.error(f"Error saving chunks to CSV: {e}")
         traceback.print_exc()
 
-def main():
-    parser = argparse.ArgumentParser(description="Chunk frame metadata and OCR data for embedding")
-    parser.add_argument("--input-file", required=True, help="Path to metadata JSON file")
-    parser.add_argument("--output-dir", required=True, help="Directory to save chunks")
-    parser.add_argument("--frame-id", required=True, help="Frame ID")
-    parser.add_argument("--frame-path", required=True, help="Path to frame image")
-    parser.add_argument("--ocr-file", help="Path to OCR structured data JSON file")
-    parser.add_argument("--chunk-size", type=int, default=500, help="Size of chunks")
-    parser.add_argument("--chunk-overlap", type=int, default=50, help="Overlap between chunks")
-    parser.add_argument("--max-chunks", type=int, default=10, help="Maximum chunks per frame")
-    
-    args = parser.parse_args()
+@functools.lru_cache(maxsize=None)
+def get_chunker(chunk_size: int, chunk_overlap: int) -> MetadataChunker:
+    """Get the chunker for the given settings, built once and shared by all frames."""
+    return MetadataChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+def run(input_file: str, output_dir: str, frame_id: str, frame_path: str, ocr_file: Optional[str] = None,
+        chunk_size: int = 500, chunk_overlap: int = 50, max_chunks: int = 10) -> int:
+    """
+    Chunk a frame's metadata and OCR data and save the chunks.
     
+    Args:
+        input_file: Path to metadata JSON file
+        output_dir: Directory to save chunks
+        frame_id: Frame ID
+        frame_path: Path to frame image
+        ocr_file: Path to OCR structured data JSON file
+        chunk_size: Size of chunks
+        chunk_overlap: Overlap between chunks
+        max_chunks: Maximum chunks per frame
+        
+    Returns:
+        Exit code: 0 on success, 1 on failure
+    """
     # Load metadata
-    metadata = load_json_file(args.input_file)
+    metadata = load_json_file(input_file)
     if not metadata:
-        sys.exit(1)
+        return 1
     
     # Load OCR data if available
     ocr_data = None
-    if args.ocr_file:
-        ocr_data = load_json_file(args.ocr_file)
-        logger.info(f"Loaded OCR data from {args.ocr_file}")
+    if ocr_file:
+        ocr_data = load_json_file(ocr_file)
+        logger.info(f"Loaded OCR data from {ocr_file}")
     
-    # Initialize chunker
-    chunker = MetadataChunker(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap)
+    # Get the chunker; it keeps no per-frame state
+    chunker = get_chunker(chunk_size, chunk_overlap)
     
     # Process metadata and OCR data into chunks
     chunks = chunker.process_metadata(
         metadata=metadata,
-        record_id=args.frame_id,
-        frame_path=args.frame_path,
+        record_id=frame_id,
+        frame_path=frame_path,
         ocr_data=ocr_data
     )
     
     # Apply max chunks limit if needed
-    if args.max_chunks and len(chunks) > args.max_chunks:
-        logger.info(f"Limiting chunks from {len(chunks)} to {args.max_chunks}")
-        chunks = chunks[:args.max_chunks]
+    if max_chunks and len(chunks) > max_chunks:
+        logger.info(f"Limiting chunks from {len(chunks)} to {max_chunks}")
+        chunks = chunks[:max_chunks]
     
     # Save chunks
-    success = save_chunks(chunks, args.output_dir)
+    success = save_chunks(chunks, output_dir)
     
     if success:
-        logger.info(f"Successfully processed {len(chunks)} chunks for frame {args.frame_id}")
+        logger.info(f"Successfully processed {len(chunks)} chunks for frame {frame_id}")
         if ocr_data:
             logger.info(f"Chunks include OCR data")
         
         # Create a payload for reference
         payload = chunker.create_metadata_payload(
             chunks=chunks,
-            record_id=args.frame_id,
-            frame_path=args.frame_path,
+            record_id=frame_id,
+            frame_path=frame_path,
             ocr_data=ocr_data
         )
         
         # Save the complete payload for reference
-        payload_file = os.path.join(args.output_dir, "payload.json")
+        payload_file = os.path.join(output_dir, "payload.json")
         try:
             with open(payload_file, 'w', encoding='utf-8') as f:
                 json.dump(payload, f, indent=2)
             logger.info(f"Saved payload to {payload_file}")
         except Exception as e:
             logger.error(f"Error saving payload: {e}")
-    else:
-        logger.error(f"Failed to process chunks for frame {args.frame_id}")
-        sys.exit(1)
+        return 0
+    
+    logger.error(f"Failed to process chunks for frame {frame_id}")
+    return 1
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunk frame metadata and OCR data for embedding")
+    parser.add_argument("--input-file", required=True, help="Path to metadata JSON file")
+    parser.add_argument("--output-dir", required=True, help="Directory to save chunks")
+    parser.add_argument("--frame-id", required=True, help="Frame ID")
+    parser.add_argument("--frame-path", required=True, help="Path to frame image")
+    parser.add_argument("--ocr-file", help="Path to OCR structured data JSON file")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Size of chunks")
+    parser.add_argument("--chunk-overlap", type=int, default=50, help="Overlap between chunks")
+    parser.add_argument("--max-chunks", type=int, default=10, help="Maximum chunks per frame")
+    
+    args = parser.parse_args()
+    
+    exit_code = run(
+        args.input_file,
+        args.output_dir,
+        args.frame_id,
+        args.frame_path,
+        ocr_file=args.ocr_file,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+        max_chunks=args.max_chunks
+    )
+    if exit_code:
+        sys.exit(exit_code)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
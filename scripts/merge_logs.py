@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Merge Logs - Combine per-worker master log shards into a single log.
+
+The frame pipeline writes one master log shard per worker process and thread
+(master_log_<timestamp>_<pid>_<shard>.jsonl). All shards of a run share the
+run timestamp the pipeline logs at start-up. This script merges the shards
+into a single JSONL file ordered by entry timestamp.
+
+Usage:
+  python merge_logs.py --output merged.jsonl
+  python merge_logs.py --run 2024-05-01_12-00-00 --output merged.jsonl
+"""
+
+import os
+import sys
+import json
+import heapq
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, Any, Iterator, List
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("merge_logs")
+
+DEFAULT_LOG_DIR = "all_frame_embeddings/logs/master_logs"
+
+def read_shard(shard_file: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read the entries of one log shard, skipping lines that are not valid JSON.
+    
+    Args:
+        shard_file: Path to the shard file
+        
+    Returns:
+        Iterator over log entries in file order
+    """
+    last_timestamp = ""
+    with open(shard_file, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping invalid line {line_number} in {shard_file}: {e}")
+                continue
+            
+            # Shards written by older pipeline versions may be slightly out of order
+            timestamp = entry.get("timestamp", "")
+            if timestamp < last_timestamp:
+                logger.warning(f"Line {line_number} in {shard_file} is out of timestamp order; merged order may be off")
+            last_timestamp = max(last_timestamp, timestamp)
+            yield entry
+
+def merge_shards(shard_files: List[Path], output_file: str) -> int:
+    """
+    Merge log shards into one file ordered by timestamp.
+    
+    The pipeline stamps and queues each shard's entries under one lock, so
+    every shard is in timestamp order and the shards are merged
+    incrementally rather than loaded and sorted in memory.
+    
+    Args:
+        shard_files: Paths to the shard files
+        output_file: Path to the merged output file
+        
+    Returns:
+        Number of entries written
+    """
+    count = 0
+    entries = heapq.merge(
+        *(read_shard(shard_file) for shard_file in shard_files),
+        key=lambda entry: entry.get("timestamp", "")
+    )
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + '\n')
+            count += 1
+    
+    return count
+
+def main():
+    """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description="Merge master log shards into a single log")
+    parser.add_argument("--log-dir", default=DEFAULT_LOG_DIR, help=f"Directory containing the shards (default: {DEFAULT_LOG_DIR})")
+    parser.add_argument("--run", help="Only merge shards of the run with this timestamp (YYYY-MM-DD_HH-MM-SS)")
+    parser.add_argument("--output", required=True, help="Output file path")
+    
+    args = parser.parse_args()
+    
+    pattern = f"master_log_{args.run}_*.jsonl" if args.run else "master_log_*.jsonl"
+    output_path = os.path.abspath(args.output)
+    shard_files = sorted(
+        path for path in Path(args.log_dir).glob(pattern)
+        if os.path.abspath(path) != output_path
+    )
+    
+    if not shard_files:
+        logger.error(f"No log shards matching {pattern} found in {args.log_dir}")
+        return 1
+    
+    logger.info(f"Merging {len(shard_files)} log shards")
+    count = merge_shards(shard_files, args.output)
+    logger.info(f"Wrote {count} entries to {args.output}")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
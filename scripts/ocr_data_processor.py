@@ -77,6 +77,58 @@ logger = logging.getLogger(__name__)
 AIRTABLE_RATE_LIMIT_PER_SECOND = 5  # Maximum of 5 requests per second
 AIRTABLE_RATE_LIMIT_SLEEP = 0.25  # Sleep 250ms between requests (allows ~4 req/sec)
 
+def build_ocr_chunk_rows(frame_id: str, ocr_structured: dict) -> list:
+    """
+    Build the frame_chunks.csv rows for a frame's structured OCR data, one per
+    paragraph.
+    
+    Args:
+        frame_id: ID of the frame
+        ocr_structured: Structured OCR data
+        
+    Returns:
+        List of CSV rows; empty if the data has no text to chunk
+    """
+    # Extract paragraphs from OCR data to create chunks
+    paragraphs = ocr_structured.get("paragraphs", [])
+    if not paragraphs and "raw_text" in ocr_structured:
+        # If no paragraphs but raw text exists, split by newlines
+        paragraphs = [p for p in ocr_structured["raw_text"].split("\n\n") if p.strip()]
+    
+    # If no paragraphs, create a single chunk with all raw text
+    if not paragraphs and "raw_text" in ocr_structured:
+        paragraphs = [ocr_structured["raw_text"]]
+    
+    if not paragraphs:
+        return []
+    
+    # Serialize the complete OCR data
+    ocr_data_json = json.dumps(ocr_structured)
+    
+    # Get flagged status
+    is_flagged = "1" if ocr_structured.get("contains_sensitive_info", False) else "0"
+    
+    # Each paragraph is a chunk
+    timestamp = datetime.now().isoformat()
+    rows = []
+    for i, paragraph in enumerate(paragraphs):
+        # Create hash
+        chunk_hash = hashlib.md5(paragraph.encode()).hexdigest()
+        
+        rows.append([
+            frame_id,                 # frame_id
+            i,                        # chunk_index
+            paragraph,                # chunk_text (full text content)
+            timestamp,                # processed_time
+            chunk_hash,               # chunk_hash
+            len(paragraph),           # content_length
+            "ocr_only",               # source
+            ocr_data_json,            # ocr_data (complete structured data)
+            "true",                   # has_ocr
+            is_flagged                # is_flagged
+        ])
+    return rows
+
 class OCRDataProcessor:
     """Class to process OCR data, categorize it, and update Airtable"""
     
@@ -908,13 +960,6 @@ class OCRDataProcessor:
             True if successful, False otherwise
         """
         try:
-            import csv
-            import os
-            import json
-            import hashlib
-            from datetime import datetime
-            from pathlib import Path
-            
             # Determine CSV file path if not provided
             if not csv_file_path:
                 # Try to find it in the standard location
@@ -929,18 +974,10 @@ class OCRDataProcessor:
             # Check if file exists
             file_exists = csv_file.exists()
             
-            # Extract paragraphs from OCR data to create chunks
-            paragraphs = ocr_structured.get("paragraphs", [])
-            if not paragraphs and "raw_text" in ocr_structured:
-                # If no paragraphs but raw text exists, split by newlines
-                paragraphs = [p for p in ocr_structured["raw_text"].split("\n\n") if p.strip()]
-            
-            # If no paragraphs, create a single chunk with all raw text
-            if not paragraphs and "raw_text" in ocr_structured:
-                paragraphs = [ocr_structured["raw_text"]]
+            rows = build_ocr_chunk_rows(frame_id, ocr_structured)
             
-            # If still no paragraphs, we can't create chunks
-            if not paragraphs:
+            # If there are no paragraphs, we can't create chunks
+            if not rows:
                 logger.warning(f"No text content found for chunking in OCR data for {frame_id}")
                 return False
             
@@ -963,32 +1000,9 @@ class OCRDataProcessor:
                         "is_flagged"
                     ])
                 
-                # Serialize the complete OCR data
-                ocr_data_json = json.dumps(ocr_structured)
-                
-                # Get flagged status
-                is_flagged = "1" if ocr_structured.get("contains_sensitive_info", False) else "0"
-                
-                # Write each paragraph as a chunk
-                timestamp = datetime.now().isoformat()
-                for i, paragraph in enumerate(paragraphs):
-                    # Create hash
-                    chunk_hash = hashlib.md5(paragraph.encode()).hexdigest()
-                    
-                    writer.writerow([
-                        frame_id,                 # frame_id
-                        i,                        # chunk_index
-                        paragraph,                # chunk_text (full text content)
-                        timestamp,                # processed_time
-                        chunk_hash,               # chunk_hash
-                        len(paragraph),           # content_length
-                        "ocr_only",               # source
-                        ocr_data_json,            # ocr_data (complete structured data)
-                        "true",                   # has_ocr
-                        is_flagged                # is_flagged
-                    ])
+                writer.writerows(rows)
             
-            logger.info(f"Added {len(paragraphs)} OCR chunks to CSV for frame {frame_id}")
+            logger.info(f"Added {len(rows)} OCR chunks to CSV for frame {frame_id}")
             return True
             
         except Exception as e:
@@ -17,21 +17,41 @@ Options:
   --frame-id ID            Frame ID to process
   --storage-dir DIR        Directory to store results (default: all_frame_embeddings)
   --batch-size N           Number of frames to process in each batch (default: 5)
+  --frames-per-worker N    Frames each worker process handles concurrently (default: 1)
+  --gemini-batch-size N    Frames analyzed per Gemini request (default: 1)
   --dry-run                Run without making actual Airtable/DB updates
   --verbose                Enable verbose logging
 """
 
 import os
+import atexit
+
+# Tesseract runs one OpenMP thread per process; concurrency comes from the frame
+# executor instead. Set before any import that might load OpenMP.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 import sys
 import time
+import csv
+import functools
 import json
 import argparse
+import asyncio
+import hashlib
+import io
+import itertools
 import logging
+import multiprocessing.util
+import sqlite3
 import subprocess
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timedelta
 import concurrent.futures
+import queue
+import re
+import threading
 import traceback
 import google.generativeai as genai
 from api_key_rotation import ApiKeyRotator, GeminiKeyRotator
@@ -41,17 +61,65 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import custom modules
 from api_key_rotation import get_next_gemini_key, mark_gemini_key_error, mark_gemini_key_success
-# Import OCR data processor for saving chunks
-from scripts.ocr_data_processor import OCRDataProcessor
+from api_key_rotation import acquire_gemini_key, release_gemini_key, get_gemini_key_for_shard
+# Import the OCR chunk rows of the chunks CSV
+from scripts.ocr_data_processor import build_ocr_chunk_rows
 
 try:
     import google.generativeai as genai
+    # Service clients, built per API key so each model is bound to its key
+    from google.ai import generativelanguage as glm
     GEMINI_AVAILABLE = True
+    # GenerativeModel has no public way to use its own API key, so a model is
+    # bound to its key by replacing its private service clients. This is only
+    # done on the releases known to keep them in _client / _async_client;
+    # elsewhere keys are switched with the process-wide genai.configure.
+    GEMINI_CLIENT_BINDING = genai.__version__.startswith("0.8.")
 except ImportError:
     GEMINI_AVAILABLE = False
+    GEMINI_CLIENT_BINDING = False
     print("Warning: google-generativeai package not installed. Gemini features will be disabled.")
     print("Install with: pip install google-generativeai")
 
+try:
+    import tesserocr
+    from PIL import Image
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -68,25 +136,479 @@ DEFAULT_MODEL = "gemini-2.0-flash-thinking-exp"
 DEFAULT_BATCH_SIZE = 5
 MAX_CONCURRENT_PROCESSES = 3  # Maximum number of concurrent processes
 
+# Environment for Tesseract runs: a single OpenMP thread per instance, so
+# concurrent frames don't oversubscribe the cores
+TESSERACT_ENV = {**os.environ, "OMP_THREAD_LIMIT": "1", "OMP_NUM_THREADS": "1"}
+
+# Frames are downscaled so their longest side is at most this many pixels
+# before OCR (when OpenCV is installed)
+OCR_MAX_IMAGE_SIDE = 1600
+
+# OCR text shorter than this (after stripping) or with fewer distinct
+# characters is treated as empty and not sent to Gemini
+GEMINI_MIN_TEXT_LENGTH = 20
+GEMINI_MIN_UNIQUE_CHARS = 5
+
+# Processed frames are also written as Parquet (when pyarrow is installed), with
+# topics/content types as string lists; rows are buffered into row groups
+PARQUET_ROW_GROUP_SIZE = 512
+if PYARROW_AVAILABLE:
+    PARQUET_FRAMES_SCHEMA = pa.schema([
+        ("frame_id", pa.string()),
+        ("processed_time", pa.string()),
+        ("frame_path", pa.string()),
+        ("ocr_status", pa.string()),
+        ("ocr_structured", pa.bool_()),
+        ("ocr_data", pa.string()),  # Full serialized JSON data
+        ("topics", pa.list_(pa.string())),
+        ("content_types", pa.list_(pa.string())),
+        ("is_flagged", pa.bool_()),
+        ("word_count", pa.int64()),
+        ("char_count", pa.int64()),
+        ("summary", pa.string())
+    ])
+
+# Expected types of the structured data fields written to the frames CSV. The
+# validator is compiled once (when fastjsonschema is installed); data that
+# passes it is written without per-field type coercion.
+STRUCTURED_DATA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "topics": {"type": "array", "items": {"type": "string"}},
+        "content_types": {"type": "array", "items": {"type": "string"}},
+        "contains_sensitive_info": {"type": "boolean"},
+        "word_count": {"type": "integer"},
+        "char_count": {"type": "integer"},
+        "summary": {"type": "string"}
+    }
+}
+validate_structured_data = fastjsonschema.compile(STRUCTURED_DATA_SCHEMA) if FASTJSONSCHEMA_AVAILABLE else None
+
+# HTTP status codes of Gemini errors that are tied to the API key in use
+# (unauthenticated, permission denied, quota exhausted); these rotate the key
+GEMINI_KEY_ERROR_CODES = {401, 403, 429}
+
+# Longest time a batched Gemini request waits for more frames to join it
+GEMINI_BATCH_MAX_WAIT_SECONDS = 0.5
+
+# Successful Gemini requests in a row after which the batcher allows one more
+# request in flight; a 429 or 5xx response halves the limit instead
+GEMINI_SUCCESS_STREAK_TO_GROW = 20
+
+# JSON format of the Gemini analysis of one frame's OCR text
+GEMINI_OUTPUT_FORMAT = """```json
+{
+    "content_types": ["paragraph", "table", "list", "heading", "code", "api_key", "credentials", "url", "contact_info", "date_time"],
+    "topics": ["topic1", "topic2"],
+    "entities": [
+        {"text": "entity1", "type": "person|organization|location|product|other"},
+        {"text": "entity2", "type": "person|organization|location|product|other"}
+    ],
+    "urls": ["url1", "url2"],
+    "paragraphs": ["paragraph1", "paragraph2"],
+    "contains_sensitive_info": true|false,
+    "sensitive_info_explanation": "Explanation if sensitive info detected",
+    "summary": "Brief summary of content",
+    "word_count": 123,
+    "char_count": 456
+}
+```"""
+
+# Fixed instructions and output schema for the Gemini OCR analysis. The per-frame
+# OCR text is appended at the end, so all requests share an identical prefix that
+# Gemini can serve from its implicit prompt cache.
+GEMINI_PROMPT_PREFIX = f"""
+Analyze the OCR text at the end of this prompt, extracted from a screenshot or image.
+Categorize the content, extract structured information, and identify any sensitive information.
+
+Return your analysis in the following JSON format:
+{GEMINI_OUTPUT_FORMAT}
+
+Pay special attention to API keys, access tokens, and other credentials that may be visible.
+
+OCR TEXT:
+"""
+
+# Prefix for batched requests; each frame's OCR text follows a <<<FRAME:frame_id>>> line
+GEMINI_BATCH_PROMPT_PREFIX = f"""
+Analyze each of the OCR text blocks at the end of this prompt separately. Each block was
+extracted from a screenshot or image and starts with a <<<FRAME:frame_id>>> marker line.
+Categorize the content, extract structured information, and identify any sensitive information.
+
+Return a single JSON object that maps each frame_id to the analysis of its block, with each
+analysis in the following JSON format:
+{GEMINI_OUTPUT_FORMAT}
+
+Pay special attention to API keys, access tokens, and other credentials that may be visible.
+
+OCR TEXT BLOCKS:
+"""
+
+# Version of the Gemini analysis, derived from the model and prompt; cached
+# results are only reused under the same version
+GEMINI_PROMPT_VERSION = hashlib.sha256(f"{DEFAULT_MODEL}\0{GEMINI_PROMPT_PREFIX}".encode('utf-8')).hexdigest()[:16]
+
+# Gemini response cache: entries expire after a week, and beyond the size limit
+# the least recently used entries are evicted (checked every few hundred inserts).
+# Near-duplicate (semantic) lookups are opt-in by setting
+# GEMINI_SEMANTIC_CACHE_THRESHOLD (e.g. 0.97), since a near-duplicate frame can
+# still differ in a newly visible credential.
+GEMINI_CACHE_TTL_SECONDS = 7 * 24 * 3600
+GEMINI_CACHE_MAX_ENTRIES = 50000
+GEMINI_CACHE_PRUNE_INTERVAL = 500
+GEMINI_SEMANTIC_CACHE_THRESHOLD = os.environ.get("GEMINI_SEMANTIC_CACHE_THRESHOLD")
+
+# Lifetime of an explicit Gemini context cache holding GEMINI_PROMPT_PREFIX, so
+# single-frame requests only send the OCR text. Opt-in by setting
+# GEMINI_CONTEXT_CACHE_TTL_SECONDS (e.g. 3600): explicit caches have a minimum
+# size of several thousand tokens, and a shorter prefix is already served from
+# Gemini's implicit cache. The cache is recreated at 90% of its lifetime.
+GEMINI_CONTEXT_CACHE_TTL_SECONDS = os.environ.get("GEMINI_CONTEXT_CACHE_TTL_SECONDS")
+GEMINI_CACHE_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Terms that flag OCR text as sensitive when Gemini gives no usable answer;
+# matched case-insensitively without lowercasing a copy of the text
+SENSITIVE_TERMS_PATTERN = re.compile(r"api key|password", re.IGNORECASE)
+
+# JSON object inside a markdown code block of a Gemini response
+JSON_CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+# Opening fence of a streamed response, up to the start of its JSON body
+STREAM_OPENING_FENCE_PATTERN = re.compile(r"```(?:json)?\s*")
+
+def dumps_json(value: Any) -> str:
+    """Serialize a value to a compact JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+def loads_json(text: str) -> Any:
+    """Parse a JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def encode_json_file(value: Any) -> bytes:
+    """Serialize a value to indented JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, indent=2).encode('utf-8')
+
+def write_json_file(path: Path, value: Any) -> None:
+    """Write a value to a file as indented JSON, using orjson when available."""
+    Path(path).write_bytes(encode_json_file(value))
+
+def preprocess_ocr_image(frame_path: Path) -> Optional[Any]:
+    """
+    Load a frame as a binarized grayscale image sized for OCR.
+    
+    Grayscale, adaptive thresholding and downscaling large frames cut the
+    pixels Tesseract's layout analysis has to process.
+    
+    Args:
+        frame_path: Path to the frame image file
+        
+    Returns:
+        The preprocessed image array, or None if the image could not be read
+    """
+    image = cv2.imread(str(frame_path), cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        return None
+    
+    height, width = image.shape
+    longest_side = max(height, width)
+    if longest_side > OCR_MAX_IMAGE_SIDE:
+        scale = OCR_MAX_IMAGE_SIDE / longest_side
+        image = cv2.resize(image, (round(width * scale), round(height * scale)), interpolation=cv2.INTER_AREA)
+    
+    return cv2.adaptiveThreshold(image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 15)
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dirs(storage_dir: str) -> None:
+    """Create the storage directory tree once per process."""
+    for subdir in ("payloads/json", "payloads/csv", "payloads/ocr", "payloads/chunks", "logs/master_logs"):
+        os.makedirs(f"{storage_dir}/{subdir}", exist_ok=True)
+
+def get_frames_per_worker(options) -> int:
+    """Frames a worker process handles together; at least one Gemini batch."""
+    return max(getattr(options, "frames_per_worker", 1), getattr(options, "gemini_batch_size", 1), 1)
+
+def is_degenerate_ocr_text(ocr_text: str) -> bool:
+    """
+    Check whether OCR text is too short or repetitive to be worth structuring.
+    
+    Args:
+        ocr_text: The OCR text to check
+        
+    Returns:
+        True if the text should not be sent to Gemini
+    """
+    stripped = ocr_text.strip()
+    return len(stripped) < GEMINI_MIN_TEXT_LENGTH or len(set(stripped)) < GEMINI_MIN_UNIQUE_CHARS
+
+def empty_structured_data(ocr_text: str) -> Dict[str, Any]:
+    """
+    Build the structured data for a frame whose OCR text was not structured.
+    
+    Args:
+        ocr_text: The raw OCR text of the frame
+        
+    Returns:
+        Structured data dictionary with empty analysis fields
+    """
+    return {
+        "raw_text": ocr_text,
+        "content_types": [],
+        "topics": [],
+        "entities": [],
+        "urls": [],
+        "paragraphs": [],
+        "contains_sensitive_info": False,
+        "summary": "",
+        "word_count": len(ocr_text.split()),
+        "char_count": len(ocr_text)
+    }
+
+def extract_json_content(response_text: str) -> str:
+    """
+    Get the JSON part of a Gemini response, which may be wrapped in a
+    markdown code block.
+    
+    Args:
+        response_text: The text of the Gemini response
+        
+    Returns:
+        The JSON content as a string
+    """
+    match = JSON_CODE_BLOCK_PATTERN.search(response_text)
+    return match.group(1) if match else response_text
+
+def gemini_json_generation_config() -> Any:
+    """
+    Build the generation config that makes Gemini answer with bare JSON
+    instead of a markdown code block.
+    
+    Returns:
+        The GenerationConfig
+    """
+    return genai.GenerationConfig(response_mime_type="application/json")
+
+def read_gemini_stream(response) -> str:
+    """
+    Collect the text of a streamed Gemini response, stopping as soon as its
+    markdown code block is closed so trailing text is not waited for.
+    
+    The block only counts as closed when the text after the opening fence
+    decodes as a complete JSON value followed by the closing fence, so code
+    fences repeated inside JSON strings (common in OCR of screen recordings)
+    don't cut the response short.
+    
+    Args:
+        response: A Gemini response requested with stream=True
+        
+    Returns:
+        The response text received
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    for chunk in response:
+        # Only a chunk that completes a fence can close the block
+        scan_from = max(0, len(buffer) - 2)
+        buffer += chunk.text
+        if "```" not in buffer[scan_from:]:
+            continue
+        
+        fence = buffer.find("```")
+        body_start = STREAM_OPENING_FENCE_PATTERN.match(buffer, fence).end()
+        try:
+            _, body_end = decoder.raw_decode(buffer, body_start)
+        except ValueError:
+            continue
+        if buffer[body_end:].lstrip().startswith("```"):
+            break
+    return buffer
+
+def to_int(value: Any) -> int:
+    """Convert a count reported by Gemini to an int, defaulting to 0."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+class BackgroundWriter:
+    """
+    Appends text to open files and writes whole files from a daemon thread, so
+    log, CSV and JSON output stays off the frame processing path.
+    
+    Writes are queued in order; a full queue blocks the caller rather than
+    dropping output. The thread drains up to max_batch queued items at a time
+    and issues one write per file and at most one flush per file for them.
+    Whole files are written to a temporary name and then moved into place, so
+    readers never see a partly written file.
+    """
+    
+    def __init__(self, maxsize: int = 10000, max_batch: int = 64):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.max_batch = max_batch
+        self._thread = threading.Thread(target=self._run, name="pipeline-writer", daemon=True)
+        self._thread.start()
+    
+    def write(self, fh, text: str) -> None:
+        """Queue text to be appended to an open file."""
+        self._queue.put((fh, text))
+    
+    def flush(self, fh) -> None:
+        """Queue a flush of an open file after the writes queued before it."""
+        self._queue.put((fh, None))
+    
+    def write_file(self, path: Path, data: bytes) -> concurrent.futures.Future:
+        """
+        Queue data to be written to a file, replacing any existing file.
+        
+        Args:
+            path: Path of the file to write
+            data: The complete file content
+            
+        Returns:
+            Future that is done once the file is in place
+        """
+        future = concurrent.futures.Future()
+        self._queue.put((path, data, future))
+        return future
+    
+    def close(self) -> None:
+        """Write everything queued so far and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+    
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            # Block for the first item, then take whatever else is already queued
+            items = [self._queue.get()]
+            while len(items) < self.max_batch:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Group the texts per file (keeping their order) and note which files
+            # need a flush once their writes are done
+            pending = {}
+            to_flush = []
+            files = []
+            for item in items:
+                if item is None:
+                    stopping = True
+                    continue
+                if len(item) == 3:
+                    files.append(item)
+                    continue
+                fh, text = item
+                if text is None:
+                    if fh not in to_flush:
+                        to_flush.append(fh)
+                else:
+                    pending.setdefault(fh, []).append(text)
+            
+            for fh, texts in pending.items():
+                try:
+                    fh.write("".join(texts))
+                except Exception as e:
+                    logger.error(f"Error writing to {getattr(fh, 'name', fh)}: {str(e)}")
+            
+            for fh in to_flush:
+                try:
+                    fh.flush()
+                except Exception as e:
+                    logger.error(f"Error flushing {getattr(fh, 'name', fh)}: {str(e)}")
+            
+            for path, data, future in files:
+                try:
+                    tmp_path = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'wb') as f:
+                        f.write(data)
+                    os.replace(tmp_path, path)
+                    future.set_result(path)
+                except Exception as e:
+                    logger.error(f"Error writing {path}: {str(e)}")
+                    future.set_exception(e)
+
 class MasterLogger:
     """Handles detailed logging of the OCR processing pipeline."""
     
-    def __init__(self, storage_dir: str):
+    # Shard numbers, unique within the process across all loggers
+    _shard_numbers = itertools.count()
+    
+    def __init__(self, storage_dir: str, writer: Optional[BackgroundWriter] = None,
+                 run_timestamp: Optional[str] = None):
         self.storage_dir = storage_dir
         self.logs_dir = Path(f"{storage_dir}/logs")
         self.master_log_dir = Path(f"{storage_dir}/logs/master_logs")
         
+        # Large texts (OCR text, prompts, responses) are stored once here, named by
+        # their SHA-256, and referenced from the log entries
+        self.blobs_dir = Path(f"{storage_dir}/payloads/blobs")
+        
         # Create log directories
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self.master_log_dir.mkdir(parents=True, exist_ok=True)
         
-        # Generate timestamp for this run
-        self.timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        # Timestamp of this run; worker processes are given the parent's so all
+        # shards of a run share it
+        self.timestamp = run_timestamp or datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        
+        # Master log shards, one per process and thread, opened on the thread's
+        # first entry; each thread's entries stay in timestamp order in its own
+        # shard without a lock (merge shards with scripts/merge_logs.py)
+        self._shard = threading.local()
+        self._shard_handles = []
+        self._shard_handles_lock = threading.Lock()
         
-        # Create master log file
-        self.master_log_file = Path(f"{self.master_log_dir}/master_log_{self.timestamp}.jsonl")
+        self._owns_writer = writer is None
+        self.writer = writer or BackgroundWriter()
+        if self._owns_writer:
+            atexit.register(self.close)
         
-        logger.info(f"Master logging initialized: {self.master_log_file}")
+        logger.info(f"Master logging initialized: {self.master_log_dir}")
+    
+    def _log_handle(self):
+        """
+        Return the current thread's master log shard, opening it on first use.
+        Shards are kept open for the whole run with a large buffer; entries are
+        appended by a background writer (shared with the caller if given) and
+        flushed when a frame completes.
+        """
+        fh = getattr(self._shard, "fh", None)
+        if fh is None:
+            # Numbered rather than named by thread ident, which a later thread
+            # may reuse while the earlier shard is still open
+            shard_file = self.master_log_dir / (
+                f"master_log_{self.timestamp}_{os.getpid()}_{next(MasterLogger._shard_numbers)}.jsonl"
+            )
+            fh = open(shard_file, 'a', encoding='utf-8', buffering=1 << 16)
+            with self._shard_handles_lock:
+                self._shard_handles.append(fh)
+            self._shard.fh = fh
+        return fh
+    
+    def flush(self) -> None:
+        """Flush the current thread's buffered log entries to its shard."""
+        fh = getattr(self._shard, "fh", None)
+        if fh is not None:
+            self.writer.flush(fh)
+    
+    def close(self) -> None:
+        """
+        Close the master log shards. A shared writer must be closed by its
+        owner first so queued entries are written.
+        """
+        if self._owns_writer:
+            self.writer.close()
+        with self._shard_handles_lock:
+            for fh in self._shard_handles:
+                if not fh.closed:
+                    fh.close()
     
     def log_ocr_processing(self, frame_id: str, entry_type: str, data: Dict[str, Any]) -> None:
         """
@@ -106,9 +628,8 @@ class MasterLogger:
                 "data": data
             }
             
-            # Append to the master log file (JSONL format - one JSON object per line)
-            with open(self.master_log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            # Append to this thread's master log shard (JSONL format - one JSON object per line)
+            self.writer.write(self._log_handle(), dumps_json(log_entry) + '\n')
                 
         except Exception as e:
             logger.error(f"Error writing to master log: {str(e)}")
@@ -130,21 +651,62 @@ class MasterLogger:
             "elapsed_time_seconds": elapsed_time,
             "details": details
         })
+        
+        # Make sure every finished frame reaches the disk, even if the process
+        # dies before the log is closed
+        self.flush()
+    
+    def store_blob(self, text: str, source_file: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Store a text in the content-addressed blob store.
+        
+        Args:
+            text: The text to store
+            source_file: Optional file that already holds exactly this text; it is
+                hard-linked into the store instead of being written again
+            
+        Returns:
+            Reference to the blob for use in log entries
+        """
+        data = text.encode('utf-8')
+        text_hash = hashlib.sha256(data).hexdigest()
+        blob_file = self.blobs_dir / text_hash[:2] / f"{text_hash}.txt"
+        
+        # Identical texts share one blob
+        try:
+            if not blob_file.exists():
+                blob_file.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    # Only link a source whose bytes match (no newline translation)
+                    if source_file is None or os.path.getsize(source_file) != len(data):
+                        raise OSError("no matching source file")
+                    os.link(source_file, blob_file)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    # Written by the background writer, under a temporary name so
+                    # concurrent workers never see a partial blob
+                    self.writer.write_file(blob_file, data)
+        except Exception as e:
+            logger.error(f"Error storing blob {text_hash}: {str(e)}")
+        
+        return {"blob_sha256": text_hash, "size": len(data)}
     
     def log_raw_ocr(self, frame_id: str, ocr_text: str, file_path: str) -> None:
         """Log the raw OCR text extracted from the frame."""
         self.log_ocr_processing(frame_id, "raw_ocr", {
-            "ocr_text": ocr_text,
+            "ocr_text": self.store_blob(ocr_text, str(file_path)),
             "file_path": str(file_path),
             "char_count": len(ocr_text),
             "word_count": len(ocr_text.split()) if ocr_text else 0,
-            "line_count": len(ocr_text.splitlines()) if ocr_text else 0
+            # Count line breaks rather than building a list of lines
+            "line_count": ocr_text.count('\n') + (not ocr_text.endswith('\n')) if ocr_text else 0
         })
     
     def log_gemini_request(self, frame_id: str, prompt: str, model: str) -> None:
         """Log the prompt sent to Gemini API."""
         self.log_ocr_processing(frame_id, "gemini_request", {
-            "prompt": prompt,
+            "prompt": self.store_blob(prompt),
             "model": model,
             "timestamp": datetime.now().isoformat()
         })
@@ -153,7 +715,7 @@ class MasterLogger:
                            model: str, elapsed_time: float) -> None:
         """Log the response received from Gemini API."""
         self.log_ocr_processing(frame_id, "gemini_response", {
-            "response_text": response_text,
+            "response_text": self.store_blob(response_text),
             "model": model,
             "elapsed_time_seconds": elapsed_time,
             "response_length": len(response_text)
@@ -162,6 +724,10 @@ class MasterLogger:
     def log_parsed_data(self, frame_id: str, structured_data: Dict[str, Any], 
                        parsing_issues: Optional[str] = None) -> None:
         """Log the parsed structured data extracted from Gemini's response."""
+        # The OCR text is already in the blob store from the raw_ocr entry
+        if isinstance(structured_data.get("raw_text"), str):
+            structured_data = {**structured_data, "raw_text": self.store_blob(structured_data["raw_text"])}
+        
         self.log_ocr_processing(frame_id, "parsed_data", {
             "structured_data": structured_data,
             "parsing_issues": parsing_issues
@@ -186,6 +752,291 @@ class MasterLogger:
             "traceback": traceback_str
         })
 
+class GeminiResponseCache:
+    """
+    SQLite cache of structured Gemini results keyed by OCR text.
+    
+    Exact lookups use the SHA-256 of the OCR text. When a semantic threshold is
+    given and sentence-transformers is installed, entries also store a text
+    embedding so near-identical OCR text (adjacent frames of the same screen)
+    can reuse a result. Embeddings are kept in memory once read; each lookup
+    only reads the rows added since the previous one.
+    """
+    
+    def __init__(self, db_path: str, namespace: str, semantic_threshold: Optional[float] = None):
+        self.db_path = db_path
+        self.namespace = namespace
+        self.semantic_threshold = semantic_threshold if SENTENCE_TRANSFORMERS_AVAILABLE else None
+        self._model = None
+        
+        # In-memory copy of the cached embeddings: blocks of rows and the text
+        # hash of each row, up to the highest rowid read so far
+        self._embedding_blocks = []
+        self._embedding_hashes = []
+        self._last_rowid = 0
+        self._puts_since_prune = 0
+        
+        # last_used_at of entries hit since the last write, by text hash; written
+        # together with the prune (or once enough pile up) instead of per hit
+        self._pending_last_used = {}
+        
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS gemini_cache (
+                namespace TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL,
+                embedding BLOB,
+                structured_data TEXT NOT NULL,
+                PRIMARY KEY (namespace, text_hash)
+            )
+            """)
+            
+            # Caches created before LRU eviction lack the last_used_at column
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(gemini_cache)")}
+            if "last_used_at" not in columns:
+                self.conn.execute("ALTER TABLE gemini_cache ADD COLUMN last_used_at REAL")
+            self.conn.commit()
+    
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Return the cache key for an OCR text."""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def embed(self, text: str) -> Optional["np.ndarray"]:
+        """Embed OCR text for semantic lookups, or None when they are disabled."""
+        if self.semantic_threshold is None:
+            return None
+        if self._model is None:
+            self._model = SentenceTransformer(GEMINI_CACHE_EMBEDDING_MODEL)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+    
+    def get_exact(self, text_hash: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result by OCR text hash."""
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT structured_data FROM gemini_cache "
+                "WHERE namespace = ? AND text_hash = ? AND created_at > ?",
+                (self.namespace, text_hash, now - GEMINI_CACHE_TTL_SECONDS)
+            ).fetchone()
+            if row:
+                self._pending_last_used[text_hash] = now
+                if len(self._pending_last_used) >= GEMINI_CACHE_PRUNE_INTERVAL:
+                    self._write_last_used()
+                    self.conn.commit()
+        return json.loads(row[0]) if row else None
+    
+    def get_semantic(self, embedding: Optional["np.ndarray"]) -> Optional[Dict[str, Any]]:
+        """Look up the most similar cached result above the semantic threshold."""
+        if embedding is None:
+            return None
+        
+        with self._lock:
+            # Read the embeddings added (by any process) since the last lookup
+            rows = self.conn.execute(
+                "SELECT rowid, text_hash, embedding FROM gemini_cache "
+                "WHERE namespace = ? AND rowid > ? AND embedding IS NOT NULL ORDER BY rowid",
+                (self.namespace, self._last_rowid)
+            ).fetchall()
+            if rows:
+                self._last_rowid = rows[-1][0]
+                self._embedding_blocks.append(np.stack([np.frombuffer(row[2], dtype=np.float32) for row in rows]))
+                self._embedding_hashes.extend(row[1] for row in rows)
+                if len(self._embedding_blocks) > 32:
+                    self._embedding_blocks = [np.vstack(self._embedding_blocks)]
+            
+            if not self._embedding_hashes:
+                return None
+            similarities = np.concatenate([block @ embedding for block in self._embedding_blocks])
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.semantic_threshold:
+                return None
+            text_hash = self._embedding_hashes[best]
+        
+        # The entry may have expired or been evicted since it was read
+        return self.get_exact(text_hash)
+    
+    def put(self, text_hash: str, embedding: Optional["np.ndarray"], structured_data: Dict[str, Any]) -> None:
+        """Store a structured result for an OCR text."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO gemini_cache "
+                "(namespace, text_hash, created_at, last_used_at, embedding, structured_data) VALUES (?, ?, ?, ?, ?, ?)",
+                (self.namespace, text_hash, now, now,
+                 embedding.tobytes() if embedding is not None else None,
+                 dumps_json(structured_data))
+            )
+            self.conn.commit()
+            
+            # The new row already has the current last_used_at
+            self._pending_last_used.pop(text_hash, None)
+            
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= GEMINI_CACHE_PRUNE_INTERVAL:
+                self._prune()
+    
+    def _write_last_used(self) -> None:
+        """Write the pending last_used_at updates; the caller commits."""
+        if not self._pending_last_used:
+            return
+        self.conn.executemany(
+            "UPDATE gemini_cache SET last_used_at = ? WHERE namespace = ? AND text_hash = ?",
+            [(used_at, self.namespace, text_hash) for text_hash, used_at in self._pending_last_used.items()]
+        )
+        self._pending_last_used = {}
+    
+    def _prune(self) -> None:
+        """Delete expired entries and the least recently used ones over the size limit."""
+        # Eviction below orders by last use, so bring it up to date first
+        self._write_last_used()
+        
+        # Expired entries go in every namespace, including those of earlier prompt versions
+        self.conn.execute(
+            "DELETE FROM gemini_cache WHERE created_at <= ?",
+            (time.time() - GEMINI_CACHE_TTL_SECONDS,)
+        )
+        self.conn.execute(
+            "DELETE FROM gemini_cache WHERE namespace = ? AND text_hash IN ("
+            "SELECT text_hash FROM gemini_cache WHERE namespace = ? "
+            "ORDER BY COALESCE(last_used_at, created_at) DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, GEMINI_CACHE_MAX_ENTRIES)
+        )
+        self.conn.commit()
+        
+        # Reload the in-memory embeddings without the deleted rows
+        self._embedding_blocks = []
+        self._embedding_hashes = []
+        self._last_rowid = 0
+        self._puts_since_prune = 0
+    
+    def close(self) -> None:
+        """Write the pending last_used_at updates and close the database."""
+        with self._lock:
+            if self.conn is None:
+                return
+            self._write_last_used()
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+class GeminiBatcher:
+    """
+    Combines the Gemini requests of frames processed concurrently into one
+    request, so the per-request overhead is paid once per batch.
+    
+    A batch is sent once it holds batch_size frames or max_wait seconds after
+    its first frame arrived. send_batch is a coroutine function that takes a
+    list of (frame_id, ocr_text) and returns the response text per frame_id;
+    each caller gets its frame's text (or the batch's exception) through the
+    Future returned by submit.
+    
+    Requests are awaited on a single event loop thread, so new batches keep
+    forming while earlier ones are in flight. The number of outstanding
+    requests is limited additive-increase/multiplicative-decrease style: the
+    limit starts at max_in_flight, is halved on a 429 or 5xx error and grows
+    by one after GEMINI_SUCCESS_STREAK_TO_GROW successes in a row. A frame
+    whose OCR text is identical to one already queued or in flight shares
+    that frame's Future instead of being sent again.
+    """
+    
+    def __init__(self, send_batch, batch_size: int, max_wait: float = GEMINI_BATCH_MAX_WAIT_SECONDS,
+                 max_in_flight: int = MAX_CONCURRENT_PROCESSES):
+        self.send_batch = send_batch
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self.max_in_flight = max_in_flight
+        self._limit = max_in_flight
+        self._active = 0
+        self._successes = 0
+        self._slots = threading.Condition()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="gemini-event-loop", daemon=True).start()
+        self._thread = threading.Thread(target=self._run, name="gemini-batcher", daemon=True)
+        self._thread.start()
+    
+    def submit(self, frame_id: str, ocr_text: str) -> concurrent.futures.Future:
+        """Queue a frame's OCR text for the next batch."""
+        with self._pending_lock:
+            future = self._pending.get(ocr_text)
+            if future is not None:
+                logger.info(f"Sharing the Gemini request of identical OCR text for {frame_id}")
+                return future
+            future = concurrent.futures.Future()
+            self._pending[ocr_text] = future
+        
+        future.add_done_callback(lambda _: self._forget(ocr_text))
+        self._queue.put((frame_id, ocr_text, future))
+        return future
+    
+    def _forget(self, ocr_text: str) -> None:
+        with self._pending_lock:
+            self._pending.pop(ocr_text, None)
+    
+    def _run(self) -> None:
+        while True:
+            # Block for the first frame, then wait up to max_wait for the rest
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            # Wait for a free request slot, then hand the batch to the event loop
+            # without waiting for its response
+            with self._slots:
+                self._slots.wait_for(lambda: self._active < self._limit)
+                self._active += 1
+            asyncio.run_coroutine_threadsafe(self._send(batch), self._loop)
+    
+    def _release_slot(self, error: Optional[Exception]) -> None:
+        with self._slots:
+            self._active -= 1
+            code = getattr(error, "code", None)
+            if error is None:
+                self._successes += 1
+                if self._successes >= GEMINI_SUCCESS_STREAK_TO_GROW:
+                    self._successes = 0
+                    if self._limit < self.max_in_flight:
+                        self._limit += 1
+                        logger.info(f"Raised Gemini in-flight request limit to {self._limit}")
+            elif isinstance(code, int) and (code == 429 or 500 <= code < 600):
+                self._successes = 0
+                if self._limit > 1:
+                    self._limit //= 2
+                    logger.warning(f"Gemini returned {code}, lowered in-flight request limit to {self._limit}")
+            self._slots.notify_all()
+    
+    async def _send(self, batch: List[Tuple[str, str, concurrent.futures.Future]]) -> None:
+        error = None
+        try:
+            responses = await self.send_batch([(frame_id, ocr_text) for frame_id, ocr_text, _ in batch])
+        except Exception as e:
+            error = e
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        finally:
+            self._release_slot(error)
+        
+        for frame_id, _, future in batch:
+            if frame_id in responses:
+                future.set_result(responses[frame_id])
+            else:
+                future.set_exception(ValueError(f"Batched Gemini response has no result for {frame_id}"))
+
 class FrameProcessor:
     """Process frames through the complete pipeline."""
     
@@ -193,12 +1044,27 @@ class FrameProcessor:
         """Initialize the frame processor with options."""
         self.options = options
         self.storage_dir = options.storage_dir
+        
+        # Per-frame output directories, built once instead of per frame
+        self._json_dir = Path(self.storage_dir) / "payloads" / "json"
+        self._ocr_dir = Path(self.storage_dir) / "payloads" / "ocr"
+        self._chunks_dir = Path(self.storage_dir) / "payloads" / "chunks"
         self.dry_run = options.dry_run
         self.verbose = options.verbose
         self.batch_size = options.batch_size
         self.processed_count = 0
         self.error_count = 0
         
+        # Idle tesserocr API instances, kept alive so the language model is only
+        # loaded once per instance; grows to the number of concurrent OCR calls
+        self.tess_api_pool = queue.Queue()
+        
+        # Log and CSV output is written from a background thread
+        self.writer = BackgroundWriter()
+        
+        # Futures of per-frame JSON files still queued on the writer, by path
+        self._pending_writes = {}
+        
         # Set up storage directories
         self.setup_directories()
         
@@ -208,8 +1074,37 @@ class FrameProcessor:
         # Set up Gemini if available
         self.setup_gemini()
         
+        # Frames handed to a worker together (frames_per_worker) run on threads;
+        # their Gemini requests, of up to gemini_batch_size frames each, are in
+        # flight together on the batcher's event loop
+        self.gemini_batch_size = max(1, getattr(options, "gemini_batch_size", 1))
+        self.frames_per_worker = get_frames_per_worker(options)
+        self.gemini_batcher = None
+        if self.frames_per_worker > 1 and self.gemini_available:
+            self.gemini_batcher = GeminiBatcher(
+                self.send_gemini_batch,
+                self.gemini_batch_size,
+                max_in_flight=self.frames_per_worker
+            )
+        
+        # OCR still runs one frame at a time per worker when frames run on threads
+        self._ocr_lock = threading.Lock()
+        
         # Initialize master logger
-        self.master_logger = MasterLogger(self.storage_dir)
+        self.master_logger = MasterLogger(
+            self.storage_dir,
+            self.writer,
+            run_timestamp=getattr(options, "run_timestamp", None)
+        )
+        atexit.register(self.close)
+        
+        # Cache of Gemini results, shared by runs over the same storage dir with
+        # the same model and prompt
+        self.gemini_cache = GeminiResponseCache(
+            f"{self.storage_dir}/payloads/gemini_cache.sqlite3",
+            namespace=f"{os.path.abspath(self.storage_dir)}@{GEMINI_PROMPT_VERSION}",
+            semantic_threshold=float(GEMINI_SEMANTIC_CACHE_THRESHOLD) if GEMINI_SEMANTIC_CACHE_THRESHOLD else None
+        )
         
         # Set up regular log file
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -248,64 +1143,86 @@ class FrameProcessor:
     
     def setup_directories(self):
         """Set up necessary directories for storage."""
-        # Main directories
-        os.makedirs(f"{self.storage_dir}/payloads/json", exist_ok=True)
-        os.makedirs(f"{self.storage_dir}/payloads/csv", exist_ok=True)
-        os.makedirs(f"{self.storage_dir}/payloads/ocr", exist_ok=True)
-        os.makedirs(f"{self.storage_dir}/payloads/chunks", exist_ok=True)
-        os.makedirs(f"{self.storage_dir}/logs", exist_ok=True)
-        os.makedirs(f"{self.storage_dir}/logs/master_logs", exist_ok=True)
+        _ensure_dirs(self.storage_dir)
         
     def setup_csv_files(self):
         """Set up CSV files for storing frame and chunk data."""
         # Single frame CSV file
         self.frames_csv = Path(f"{self.storage_dir}/payloads/csv/processed_frames.csv")
         
-        # Create frames CSV with header if it doesn't exist
-        if not self.frames_csv.exists():
-            os.makedirs(self.frames_csv.parent, exist_ok=True)
-            with open(self.frames_csv, 'w', encoding='utf-8', newline='') as f:
-                import csv
-                writer = csv.writer(f)
-                writer.writerow([
-                    "frame_id", 
-                    "processed_time", 
-                    "frame_path", 
-                    "ocr_status",
-                    "ocr_structured",
-                    "ocr_data",  # Full serialized JSON data
-                    "topics",
-                    "content_types",
-                    "is_flagged",
-                    "word_count",
-                    "char_count",
-                    "summary"
-                ])
+        # Keep the frames CSV open for appends instead of reopening it per frame;
+        # rows are written by the background writer
+        self._frames_csv_fh = open(self.frames_csv, 'a', encoding='utf-8', newline='', buffering=1 << 20)
+        
+        # Write the header if the file is new
+        if self._frames_csv_fh.tell() == 0:
+            writer = csv.writer(self._frames_csv_fh)
+            writer.writerow([
+                "frame_id", 
+                "processed_time", 
+                "frame_path", 
+                "ocr_status",
+                "ocr_structured",
+                "ocr_data",  # Full serialized JSON data
+                "topics",
+                "content_types",
+                "is_flagged",
+                "word_count",
+                "char_count",
+                "summary"
+            ])
+            self._frames_csv_fh.flush()
             logger.info(f"Created new single frame CSV: {self.frames_csv}")
         
         # Chunked frames CSV file
         self.chunks_csv = Path(f"{self.storage_dir}/payloads/csv/frame_chunks.csv")
         
-        # Create chunks CSV with header if it doesn't exist
-        if not self.chunks_csv.exists():
-            os.makedirs(self.chunks_csv.parent, exist_ok=True)
-            with open(self.chunks_csv, 'w', encoding='utf-8', newline='') as f:
-                import csv
-                writer = csv.writer(f)
-                writer.writerow([
-                    "frame_id",
-                    "chunk_index",
-                    "chunk_text",
-                    "processed_time",
-                    "chunk_hash",
-                    "content_length",
-                    "source",
-                    "ocr_data",  # OCR data for this chunk
-                    "has_ocr",
-                    "is_flagged"
-                ])
+        # Kept open like the frames CSV; rows are buffered per group of frames
+        # and written by the background writer (see flush_chunk_rows)
+        self._chunks_csv_fh = open(self.chunks_csv, 'a', encoding='utf-8', newline='', buffering=1 << 20)
+        self._chunk_rows = []
+        self._chunk_rows_lock = threading.Lock()
+        
+        # Write the header if the file is new
+        if self._chunks_csv_fh.tell() == 0:
+            writer = csv.writer(self._chunks_csv_fh)
+            writer.writerow([
+                "frame_id",
+                "chunk_index",
+                "chunk_text",
+                "processed_time",
+                "chunk_hash",
+                "content_length",
+                "source",
+                "ocr_data",  # OCR data for this chunk
+                "has_ocr",
+                "is_flagged"
+            ])
+            self._chunks_csv_fh.flush()
             logger.info(f"Created new chunks CSV: {self.chunks_csv}")
     
+    def flush_chunk_rows(self):
+        """Queue the buffered OCR chunk rows for the chunks CSV as one write."""
+        with self._chunk_rows_lock:
+            rows, self._chunk_rows = self._chunk_rows, []
+        if not rows:
+            return
+        
+        row_buffer = io.StringIO()
+        csv.writer(row_buffer).writerows(rows)
+        self.writer.write(self._chunks_csv_fh, row_buffer.getvalue())
+        self.writer.flush(self._chunks_csv_fh)
+    
+    def close(self):
+        """Write out queued log and CSV output and close the open files."""
+        self.flush_chunk_rows()
+        self.writer.close()
+        self.master_logger.close()
+        self.gemini_cache.close()
+        for fh in (self._frames_csv_fh, self._chunks_csv_fh):
+            if not fh.closed:
+                fh.close()
+    
     def setup_gemini(self):
         """Set up Gemini API with our preferred model."""
         if not GEMINI_AVAILABLE:
@@ -314,14 +1231,150 @@ class FrameProcessor:
             return
         
         self.gemini_available = True
+        if not GEMINI_CLIENT_BINDING:
+            logger.warning(f"google-generativeai {genai.__version__} cannot bind models to their own key; switching keys process-wide")
+        
+        # Key switches, model creation and context caches are serialized;
+        # context caches are created through the process-wide genai.configure
+        self._gemini_key_lock = threading.RLock()
+        
+        # Models by API key, built on the first use of each key and reused when
+        # requests switch back to it. Each model is bound to its key's clients.
+        self._gemini_models = {}
+        
+        # Explicit context caches of the prompt prefix by API key, if enabled,
+        # as (cache, cached model, refresh time)
+        self._gemini_context_caches = {}
         
-        # Get first key to initialize Gemini (will rotate keys later per request)
-        api_key = get_next_gemini_key()
-        genai.configure(api_key=api_key)
+        # Responses are requested as JSON; extract_json_content still handles
+        # a response that comes back wrapped in a code block anyway
+        self._gemini_generation_config = gemini_json_generation_config()
+        
+        # Configure the first key and build the model once; both are reused for
+        # every request until the key fails or runs out of request budget.
+        # Worker processes each start on a different key.
+        shard = getattr(self.options, "gemini_key_shard", None)
+        self.rotate_gemini_key(get_gemini_key_for_shard(shard) if shard is not None else None)
         
         logger.info("Gemini API initialized with rotating API keys")
         logger.info(f"Using preferred model: {DEFAULT_MODEL}")
     
+    @staticmethod
+    def bind_gemini_client(model, api_key: Optional[str]):
+        """
+        Bind a model to a client of its own API key. A model otherwise takes
+        the process-wide default client on its first request, which by then
+        may belong to another key. Without a key the default client is kept.
+        
+        Without GEMINI_CLIENT_BINDING the key is made the process-wide one
+        instead, so a model may still run on a key configured later.
+        """
+        if not api_key:
+            return model
+        if GEMINI_CLIENT_BINDING:
+            model._client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+        else:
+            genai.configure(api_key=api_key)
+        return model
+    
+    @staticmethod
+    def bind_gemini_async_client(model, api_key: Optional[str]):
+        """
+        Bind a model to an async client of its API key, created on the event
+        loop that awaits the request (the batcher's) on the model's first
+        async request.
+        """
+        if GEMINI_CLIENT_BINDING and api_key and model._async_client is None:
+            model._async_client = glm.GenerativeServiceAsyncClient(client_options={"api_key": api_key})
+        return model
+    
+    def get_gemini_model(self, api_key: str):
+        """
+        Return the model for an API key, building it on the key's first use.
+        Callers hold _gemini_key_lock.
+        """
+        model = self._gemini_models.get(api_key)
+        if model is None:
+            model = self.bind_gemini_client(genai.GenerativeModel(
+                DEFAULT_MODEL,
+                generation_config=self._gemini_generation_config
+            ), api_key)
+            self._gemini_models[api_key] = model
+        return model
+    
+    def rotate_gemini_key(self, api_key: Optional[str] = None):
+        """Switch Gemini to the given (or next) API key and that key's model."""
+        with self._gemini_key_lock:
+            self._gemini_api_key = api_key or get_next_gemini_key()
+            self._gemini_model = self.get_gemini_model(self._gemini_api_key)
+            
+            # Context caches belong to the key's project, so each key gets its own
+            if self._gemini_api_key not in self._gemini_context_caches:
+                self.refresh_gemini_context_cache(self._gemini_api_key)
+    
+    def refresh_gemini_context_cache(self, api_key: str):
+        """
+        Replace the context cache of the prompt prefix for an API key with a
+        new one. Requests send the full prompt if it cannot be created.
+        Callers hold _gemini_key_lock.
+        
+        The old cache is not deleted, since requests on other threads may still
+        be using it; it expires at the end of its TTL.
+        """
+        self._gemini_context_caches.pop(api_key, None)
+        
+        if not GEMINI_CONTEXT_CACHE_TTL_SECONDS:
+            return
+        
+        ttl_seconds = float(GEMINI_CONTEXT_CACHE_TTL_SECONDS)
+        try:
+            genai.configure(api_key=api_key)
+            cache = genai.caching.CachedContent.create(
+                model=DEFAULT_MODEL,
+                system_instruction=GEMINI_PROMPT_PREFIX,
+                ttl=timedelta(seconds=ttl_seconds)
+            )
+            cached_model = self.bind_gemini_client(genai.GenerativeModel.from_cached_content(
+                cached_content=cache,
+                generation_config=self._gemini_generation_config
+            ), api_key)
+        except Exception as e:
+            logger.warning(f"Could not create Gemini context cache, sending the full prompt: {str(e)}")
+            return
+        
+        self._gemini_context_caches[api_key] = (cache, cached_model, time.time() + ttl_seconds * 0.9)
+        logger.info(f"Created Gemini context cache {cache.name}")
+    
+    def acquire_gemini_request_key(self) -> Tuple[Optional[str], Any, Any]:
+        """
+        Take a request slot on the current Gemini key, switching to the
+        least-loaded key first if the current one has used up its rate limit.
+        
+        Returns:
+            Tuple of (API key, model, cached model). The request must use the
+            returned models, which belong to the returned key, and release the
+            key with release_gemini_key. The cached model is None if no context
+            cache is in use.
+        """
+        with self._gemini_key_lock:
+            api_key = acquire_gemini_key(preferred=self._gemini_api_key)
+            if api_key is not None and api_key != self._gemini_api_key:
+                logger.info("Switching Gemini API key, the current key has no request budget left")
+                self.rotate_gemini_key(api_key)
+            model_key = api_key or self._gemini_api_key
+            return api_key, self.get_gemini_model(model_key), self.get_gemini_cached_model(model_key)
+    
+    def get_gemini_cached_model(self, api_key: str):
+        """
+        Return the model bound to an API key's prompt prefix cache, or None if
+        not in use. Callers hold _gemini_key_lock.
+        """
+        entry = self._gemini_context_caches.get(api_key)
+        if entry is not None and time.time() >= entry[2]:
+            self.refresh_gemini_context_cache(api_key)
+            entry = self._gemini_context_caches.get(api_key)
+        return entry[1] if entry is not None else None
+    
     def save_to_csv(self, frame_id: str, frame_data: Dict[str, Any]) -> bool:
         """
         Save processed frame data to CSV file.
@@ -336,9 +1389,6 @@ class FrameProcessor:
         logger.info(f"Saving frame data to CSV for {frame_id}")
         
         try:
-            import csv
-            import json
-            
             # Get OCR data if available
             ocr_data_json = ""
             topics = ""
@@ -351,15 +1401,40 @@ class FrameProcessor:
             if "structured_data" in frame_data and frame_data["structured_data"]:
                 structured_data = frame_data["structured_data"]
                 # Serialize the OCR data to JSON string
-                ocr_data_json = json.dumps(structured_data)
+                ocr_data_json = dumps_json(structured_data)
+                
+                # Check the field types; without a validator every field is coerced
+                schema_valid = False
+                if validate_structured_data is not None:
+                    try:
+                        validate_structured_data(structured_data)
+                        schema_valid = True
+                    except fastjsonschema.JsonSchemaException as e:
+                        logger.warning(f"Structured data for {frame_id} does not match the expected schema: {e}")
+                        self.master_logger.log_error(
+                            frame_id,
+                            "invalid_structured_data",
+                            str(e),
+                            ""
+                        )
                 
                 # Extract specific fields
-                topics = "|".join(structured_data.get("topics", []))
-                content_types = "|".join(structured_data.get("content_types", []))
-                is_flagged = "1" if structured_data.get("contains_sensitive_info", False) else "0"
-                word_count = str(structured_data.get("word_count", 0))
-                char_count = str(structured_data.get("char_count", 0))
-                summary = structured_data.get("summary", "")
+                if schema_valid:
+                    topics = "|".join(structured_data.get("topics", []))
+                    content_types = "|".join(structured_data.get("content_types", []))
+                    is_flagged = "1" if structured_data.get("contains_sensitive_info", False) else "0"
+                    word_count = str(structured_data.get("word_count", 0))
+                    char_count = str(structured_data.get("char_count", 0))
+                    summary = structured_data.get("summary", "")
+                else:
+                    topics_value = structured_data.get("topics")
+                    content_types_value = structured_data.get("content_types")
+                    topics = "|".join(str(topic) for topic in topics_value) if isinstance(topics_value, list) else ""
+                    content_types = "|".join(str(content_type) for content_type in content_types_value) if isinstance(content_types_value, list) else ""
+                    is_flagged = "1" if structured_data.get("contains_sensitive_info") else "0"
+                    word_count = str(to_int(structured_data.get("word_count")))
+                    char_count = str(to_int(structured_data.get("char_count")))
+                    summary = str(structured_data.get("summary") or "")
             
             # Prepare row data
             row = [
@@ -404,11 +1479,12 @@ class FrameProcessor:
             if truncated_summary:
                 logger.info(f"CSV SUMMARY: {truncated_summary}")
             
-            # Append to CSV
-            file_exists = self.frames_csv.exists()
-            with open(self.frames_csv, 'a', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(row)
+            # Queue the row for the background writer; flushed per frame so a
+            # crashed worker loses at most the frame in flight
+            row_buffer = io.StringIO()
+            csv.writer(row_buffer).writerow(row)
+            self.writer.write(self._frames_csv_fh, row_buffer.getvalue())
+            self.writer.flush(self._frames_csv_fh)
             
             # Log the CSV save operation
             self.master_logger.log_csv_save(
@@ -494,7 +1570,8 @@ class FrameProcessor:
             frame_data["frame_path"] = str(frame_path)
             
             # 3. Process OCR if needed
-            ocr_status, ocr_data = self.process_ocr(frame_id, frame_path)
+            with self._ocr_lock:
+                ocr_status, ocr_data = self.process_ocr(frame_id, frame_path)
             frame_data["ocr_status"] = ocr_status
             
             if ocr_status == "error":
@@ -513,10 +1590,26 @@ class FrameProcessor:
                 return False, frame_data
             
             # 4. Process OCR data with Gemini if available
-            if ocr_status == "done" and self.gemini_available:
+            if ocr_status == "done" and is_degenerate_ocr_text(ocr_data):
+                logger.info(f"Skipping Gemini for {frame_id}: OCR text is empty or degenerate")
+                frame_data["ocr_structured"] = False
+                frame_data["structured_data"] = empty_structured_data(ocr_data)
+                self.master_logger.log_ocr_processing(
+                    frame_id,
+                    "gemini_skipped",
+                    {
+                        "reason": "degenerate_ocr_text",
+                        "char_count": len(ocr_data),
+                        "stripped_length": len(ocr_data.strip())
+                    }
+                )
+            elif ocr_status == "done" and self.gemini_available:
                 structured_data = self.process_ocr_with_gemini(frame_id, ocr_data)
                 frame_data["ocr_structured"] = True if structured_data else False
                 frame_data["structured_data"] = structured_data
+                if structured_data:
+                    # Structured data returned by Gemini processing is always saved here
+                    frame_data["structured_data_path"] = str(self._ocr_dir / f"{frame_id}_structured.json")
             
             # 5. Save to single frame CSV
             csv_status = self.save_to_csv(frame_id, frame_data)
@@ -657,8 +1750,8 @@ class FrameProcessor:
         logger.info(f"Processing OCR for {frame_id}")
         
         # Check if OCR already exists
-        ocr_file = Path(f"{self.storage_dir}/payloads/ocr/{frame_id}.txt")
-        if ocr_file.exists():
+        ocr_file = self._ocr_dir / f"{frame_id}.txt"
+        if os.path.exists(ocr_file):
             logger.info(f"OCR already exists for {frame_id}")
             with open(ocr_file, 'r', encoding='utf-8') as f:
                 ocr_text = f.read()
@@ -691,7 +1784,33 @@ class FrameProcessor:
             
             return "done", mock_ocr_text
         
-        # In production, run Tesseract OCR
+        # In production, run Tesseract OCR in-process when tesserocr is available
+        if TESSEROCR_AVAILABLE:
+            try:
+                ocr_text = self.run_tesserocr(frame_path)
+                with open(ocr_file, 'w', encoding='utf-8') as f:
+                    f.write(ocr_text)
+                logger.info(f"OCR successfully completed for {frame_id}")
+                
+                # Log the raw OCR data
+                self.master_logger.log_raw_ocr(frame_id, ocr_text, str(ocr_file))
+                
+                return "done", ocr_text
+                
+            except Exception as e:
+                logger.error(f"Error running OCR for {frame_id}: {str(e)}")
+                
+                # Log the error
+                self.master_logger.log_error(
+                    frame_id, 
+                    "ocr_exception",
+                    str(e),
+                    traceback.format_exc()
+                )
+                
+                return "error", None
+        
+        # Otherwise fall back to the Tesseract CLI
         try:
             # Check if tesseract is installed
             result = subprocess.run(["which", "tesseract"], capture_output=True, text=True)
@@ -708,10 +1827,20 @@ class FrameProcessor:
                 
                 return "error", None
             
-            # Run tesseract OCR
-            output_file = f"{self.storage_dir}/payloads/ocr/{frame_id}"
-            command = ["tesseract", str(frame_path), output_file]
-            subprocess.run(command, check=True)
+            # Run tesseract OCR, on a preprocessed copy of the frame if possible
+            output_file = str(self._ocr_dir / frame_id)
+            ocr_input = str(frame_path)
+            image = preprocess_ocr_image(frame_path) if OPENCV_AVAILABLE else None
+            if image is not None:
+                ocr_input = f"{output_file}_ocr_input.png"
+                cv2.imwrite(ocr_input, image)
+            
+            command = ["tesseract", ocr_input, output_file]
+            try:
+                subprocess.run(command, check=True, env=TESSERACT_ENV, capture_output=True)
+            finally:
+                if ocr_input != str(frame_path):
+                    os.remove(ocr_input)
             
             # Read the output file
             ocr_file = Path(f"{output_file}.txt")
@@ -750,6 +1879,31 @@ class FrameProcessor:
             
             return "error", None
     
+    def run_tesserocr(self, frame_path: Path) -> str:
+        """
+        Run OCR on an image with a pooled tesserocr API instance.
+        
+        Args:
+            frame_path: Path to the frame image file
+            
+        Returns:
+            The extracted OCR text
+        """
+        try:
+            api = self.tess_api_pool.get_nowait()
+        except queue.Empty:
+            api = tesserocr.PyTessBaseAPI(lang="eng")
+        
+        try:
+            image = preprocess_ocr_image(frame_path) if OPENCV_AVAILABLE else None
+            if image is not None:
+                api.SetImage(Image.fromarray(image))
+            else:
+                api.SetImageFile(str(frame_path))
+            return api.GetUTF8Text()
+        finally:
+            self.tess_api_pool.put(api)
+    
     def process_ocr_with_gemini(self, frame_id: str, ocr_text: str) -> Optional[Dict[str, Any]]:
         """
         Process OCR text with Gemini to extract structured data.
@@ -777,8 +1931,8 @@ class FrameProcessor:
             return None
         
         # Check if structured data already exists
-        structured_file = Path(f"{self.storage_dir}/payloads/ocr/{frame_id}_structured.json")
-        if structured_file.exists():
+        structured_file = self._ocr_dir / f"{frame_id}_structured.json"
+        if os.path.exists(structured_file):
             logger.info(f"Structured OCR data already exists for {frame_id}")
             try:
                 with open(structured_file, 'r', encoding='utf-8') as f:
@@ -803,90 +1957,110 @@ class FrameProcessor:
                     traceback.format_exc()
                 )
         
-        # Process with Gemini using API key rotation
-        api_key = get_next_gemini_key()
-        genai.configure(api_key=api_key)
-        
+        # Reuse the result for identical (or, if enabled, near-identical) OCR text
+        text_hash = self.gemini_cache.hash_text(ocr_text)
+        text_embedding = None
         try:
-            # Generate prompt
-            prompt = f"""
-            Analyze the following OCR text extracted from a screenshot or image.
-            Categorize the content, extract structured information, and identify any sensitive information.
-            
-            OCR TEXT:
-            {ocr_text}
-            
-            Return your analysis in the following JSON format:
-            ```json
-            {{
-                "content_types": ["paragraph", "table", "list", "heading", "code", "api_key", "credentials", "url", "contact_info", "date_time"],
-                "topics": ["topic1", "topic2"],
-                "entities": [
-                    {{"text": "entity1", "type": "person|organization|location|product|other"}},
-                    {{"text": "entity2", "type": "person|organization|location|product|other"}}
-                ],
-                "urls": ["url1", "url2"],
-                "paragraphs": ["paragraph1", "paragraph2"],
-                "contains_sensitive_info": true|false,
-                "sensitive_info_explanation": "Explanation if sensitive info detected",
-                "summary": "Brief summary of content",
-                "word_count": 123,
-                "char_count": 456
-            }}
-            ```
-            
-            Pay special attention to API keys, access tokens, and other credentials that may be visible.
-            """
-            
-            # Log the Gemini request
-            self.master_logger.log_gemini_request(
-                frame_id,
-                prompt,
-                DEFAULT_MODEL
-            )
-            
-            # Call Gemini (using the Flash model with thinking capability)
-            start_time = time.time()
-            response = genai.GenerativeModel(DEFAULT_MODEL).generate_content(prompt)
-            elapsed_time = time.time() - start_time
+            structured_data = self.gemini_cache.get_exact(text_hash)
+            if structured_data is None:
+                text_embedding = self.gemini_cache.embed(ocr_text)
+                structured_data = self.gemini_cache.get_semantic(text_embedding)
+        except Exception as e:
+            logger.warning(f"Gemini cache lookup failed for {frame_id}: {str(e)}")
+            structured_data = None
+        
+        if structured_data is not None:
+            logger.info(f"Using cached Gemini result for {frame_id}")
+            structured_data["raw_text"] = ocr_text
             
-            # Process the response
-            response_text = response.text
+            # Save to file
+            os.makedirs(structured_file.parent, exist_ok=True)
+            self.save_json_in_background(structured_file, structured_data)
             
-            # Log the Gemini response
-            self.master_logger.log_gemini_response(
+            # Log the parsed data
+            self.master_logger.log_parsed_data(
                 frame_id,
-                response_text,
-                DEFAULT_MODEL,
-                elapsed_time
+                structured_data,
+                "Loaded from Gemini response cache"
             )
             
-            # Mark the API key as successful
-            mark_gemini_key_success(api_key)
+            return structured_data
+        
+        # Process with Gemini using the current key; it is switched when it runs
+        # out of request budget and rotated on key errors
+        api_key = None
+        
+        try:
+            if self.gemini_batcher is not None:
+                # Sent from the batcher's event loop, possibly together with other
+                # frames; logging and key handling are done in send_gemini_batch
+                response_text = self.gemini_batcher.submit(frame_id, ocr_text).result()
+            else:
+                # Generate prompt; the fixed instructions come first so every request
+                # shares the same prefix
+                prompt = f"{GEMINI_PROMPT_PREFIX}{ocr_text}\n"
+                
+                # Log the Gemini request
+                self.master_logger.log_gemini_request(
+                    frame_id,
+                    prompt,
+                    DEFAULT_MODEL
+                )
+                
+                # Call Gemini (using the Flash model with thinking capability); with
+                # a context cache the prefix is already on the server. The response
+                # is streamed and read until its JSON code block is complete.
+                api_key, model, cached_model = self.acquire_gemini_request_key()
+                try:
+                    start_time = time.time()
+                    if cached_model is not None:
+                        response = cached_model.generate_content(f"{ocr_text}\n", stream=True)
+                    else:
+                        response = model.generate_content(prompt, stream=True)
+                    response_text = read_gemini_stream(response)
+                    elapsed_time = time.time() - start_time
+                finally:
+                    release_gemini_key(api_key)
+                
+                # Log the Gemini response
+                self.master_logger.log_gemini_response(
+                    frame_id,
+                    response_text,
+                    DEFAULT_MODEL,
+                    elapsed_time
+                )
+                
+                # Mark the API key as successful
+                mark_gemini_key_success(api_key)
             
             # Try to parse JSON from the response
             structured_data = None
             parsing_issues = None
             
             try:
-                # Try to find JSON content within the response
-                json_content = response_text
-                # If the response has markdown code blocks, extract the JSON
-                if "```json" in response_text:
-                    json_content = response_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in response_text:
-                    json_content = response_text.split("```")[1].split("```")[0].strip()
+                # Try to find JSON content within the response; if the response
+                # has markdown code blocks, extract the JSON. Batched results are
+                # already plain JSON.
+                if self.gemini_batcher is not None:
+                    json_content = response_text
+                else:
+                    json_content = extract_json_content(response_text)
                 
                 # Parse the JSON content
-                structured_data = json.loads(json_content)
+                structured_data = loads_json(json_content)
                 
                 # Add raw text to the structured data
                 structured_data["raw_text"] = ocr_text
                 
+                # Cache the successful result for repeated OCR text
+                try:
+                    self.gemini_cache.put(text_hash, text_embedding, structured_data)
+                except Exception as e:
+                    logger.warning(f"Could not cache Gemini result for {frame_id}: {str(e)}")
+                
                 # Save to file
                 os.makedirs(structured_file.parent, exist_ok=True)
-                with open(structured_file, 'w', encoding='utf-8') as f:
-                    json.dump(structured_data, f, indent=2)
+                self.save_json_in_background(structured_file, structured_data)
                 
                 logger.info(f"Successfully processed OCR data with Gemini for {frame_id}")
                 
@@ -905,7 +2079,7 @@ class FrameProcessor:
                     "content_types": [],
                     "topics": [],
                     "paragraphs": ocr_text.split("\n\n"),
-                    "contains_sensitive_info": "api key" in ocr_text.lower() or "password" in ocr_text.lower(),
+                    "contains_sensitive_info": SENSITIVE_TERMS_PATTERN.search(ocr_text) is not None,
                     "word_count": len(ocr_text.split()),
                     "char_count": len(ocr_text),
                     "parsing_error": str(e)
@@ -913,8 +2087,7 @@ class FrameProcessor:
                 
                 # Save to file
                 os.makedirs(structured_file.parent, exist_ok=True)
-                with open(structured_file, 'w', encoding='utf-8') as f:
-                    json.dump(structured_data, f, indent=2)
+                self.save_json_in_background(structured_file, structured_data)
                 
                 logger.info(f"Saved basic structured data for {frame_id} after parsing error")
                 
@@ -938,10 +2111,108 @@ class FrameProcessor:
                 traceback.format_exc()
             )
             
-            # Mark the API key as having an error
-            mark_gemini_key_error(api_key)
+            if self.gemini_batcher is None:
+                self.handle_gemini_key_error(api_key, e)
             return None
     
+    async def send_gemini_batch(self, items: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Analyze the OCR text of one or more frames with a single Gemini request.
+        
+        Args:
+            items: List of (frame_id, ocr_text) tuples
+            
+        Returns:
+            Dictionary mapping each frame ID found in the response to the JSON
+            text of its analysis. Frames a multi-frame response has no valid
+            result for are sent again on their own, once; if a single-frame
+            response is not valid JSON, the frame gets the raw response text.
+        """
+        api_key, model, cached_model = self.acquire_gemini_request_key()
+        
+        # A single frame uses the regular prompt (and context cache, if any)
+        if len(items) == 1:
+            prompt = f"{GEMINI_PROMPT_PREFIX}{items[0][1]}\n"
+            contents = prompt
+            if cached_model is not None:
+                model = cached_model
+                contents = f"{items[0][1]}\n"
+        else:
+            blocks = "".join(f"<<<FRAME:{frame_id}>>>\n{ocr_text}\n" for frame_id, ocr_text in items)
+            prompt = f"{GEMINI_BATCH_PROMPT_PREFIX}{blocks}"
+            contents = prompt
+        
+        # The prompt is logged for each frame; the blob store keeps one copy
+        for frame_id, _ in items:
+            self.master_logger.log_gemini_request(frame_id, prompt, DEFAULT_MODEL)
+        
+        logger.info(f"Sending Gemini request for {len(items)} frame(s)")
+        try:
+            start_time = time.time()
+            self.bind_gemini_async_client(model, api_key)
+            response = await model.generate_content_async(contents)
+            elapsed_time = time.time() - start_time
+            response_text = response.text
+        except Exception as e:
+            self.handle_gemini_key_error(api_key, e)
+            raise
+        finally:
+            release_gemini_key(api_key)
+        
+        for frame_id, _ in items:
+            self.master_logger.log_gemini_response(frame_id, response_text, DEFAULT_MODEL, elapsed_time)
+        
+        mark_gemini_key_success(api_key)
+        
+        try:
+            results = loads_json(extract_json_content(response_text))
+        except (json.JSONDecodeError, IndexError):
+            results = None
+        
+        if len(items) == 1:
+            frame_id = items[0][0]
+            return {frame_id: response_text if results is None else json.dumps(results)}
+        
+        if not isinstance(results, dict):
+            results = {}
+        parsed = {
+            frame_id: json.dumps(results[frame_id])
+            for frame_id, _ in items
+            if isinstance(results.get(frame_id), dict)
+        }
+        
+        # Fall back to one request per frame for frames the combined response
+        # did not answer; those requests are not retried again
+        missing = [item for item in items if item[0] not in parsed]
+        if missing:
+            logger.warning(f"Batched Gemini response has no result for {len(missing)} frame(s), sending them individually")
+            for single in await asyncio.gather(*(self.send_gemini_batch([item]) for item in missing), return_exceptions=True):
+                if isinstance(single, dict):
+                    parsed.update(single)
+        
+        return parsed
+    
+    def handle_gemini_key_error(self, api_key: str, error: Exception) -> None:
+        """
+        Record a failed Gemini request and rotate the key if the error is
+        tied to the key, or recreate the context cache if it is gone.
+        
+        Args:
+            api_key: The API key used for the failed request
+            error: The exception raised by the request
+        """
+        # Mark the API key as having an error; a rate-limited key cools down
+        mark_gemini_key_error(api_key, "rate_limit" if getattr(error, "code", None) == 429 else "unknown")
+        
+        # Move to the next key if this one is rejected or out of quota
+        with self._gemini_key_lock:
+            if getattr(error, "code", None) in GEMINI_KEY_ERROR_CODES and api_key == self._gemini_api_key:
+                logger.info("Rotating Gemini API key after key error")
+                self.rotate_gemini_key()
+            elif getattr(error, "code", None) == 404 and api_key in self._gemini_context_caches:
+                logger.info("Recreating expired Gemini context cache")
+                self.refresh_gemini_context_cache(api_key)
+    
     def store_in_database(self, frame_id: str, frame_data: Dict[str, Any]) -> str:
         """
         Store frame data in PostgreSQL database.
@@ -959,6 +2230,24 @@ class FrameProcessor:
         logger.warning("Not implemented: This would store data in PostgreSQL in production")
         return "simulated"
     
+    def save_json_in_background(self, path: Path, value: Any) -> None:
+        """
+        Serialize a value now and write it to a JSON file on the background
+        writer; wait_for_write blocks until the file is on disk.
+        
+        Args:
+            path: Path of the JSON file
+            value: The value to write
+        """
+        self._pending_writes[str(path)] = self.writer.write_file(path, encode_json_file(value))
+    
+    def wait_for_write(self, path: Path) -> None:
+        """Wait until a background write queued for the file has finished."""
+        future = self._pending_writes.pop(str(path), None)
+        if future is not None:
+            # Failed writes are already logged by the writer
+            future.exception()
+    
     def create_chunks(self, frame_id: str, frame_path: Path, frame_data: Dict[str, Any]) -> str:
         """
         Create metadata chunks with OCR data.
@@ -974,7 +2263,7 @@ class FrameProcessor:
         logger.info(f"Creating chunks for {frame_id}")
         
         # Create the metadata file
-        metadata_file = Path(f"{self.storage_dir}/payloads/json/{frame_id}_metadata.json")
+        metadata_file = self._json_dir / f"{frame_id}_metadata.json"
         os.makedirs(metadata_file.parent, exist_ok=True)
         
         # Create a basic metadata structure
@@ -988,70 +2277,61 @@ class FrameProcessor:
         if "metadata" in frame_data:
             metadata.update(frame_data["metadata"])
         
-        # Save the metadata
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        # Save the metadata; the chunking script reads it right away
+        write_json_file(metadata_file, metadata)
         
         # Create the OCR file if available
         ocr_file = None
         structured_data = None
         if "structured_data" in frame_data and frame_data["structured_data"]:
             structured_data = frame_data["structured_data"]
-            ocr_structured_file = Path(f"{self.storage_dir}/payloads/ocr/{frame_id}_structured.json")
-            
-            if not ocr_structured_file.exists():
+            if frame_data.get("structured_data_path"):
+                # Already written by process_ocr_with_gemini; only wait for it
+                ocr_structured_file = Path(frame_data["structured_data_path"])
+                self.wait_for_write(ocr_structured_file)
+            else:
                 # Save the structured data
+                ocr_structured_file = self._ocr_dir / f"{frame_id}_structured.json"
                 os.makedirs(ocr_structured_file.parent, exist_ok=True)
-                with open(ocr_structured_file, 'w', encoding='utf-8') as f:
-                    json.dump(structured_data, f, indent=2)
+                write_json_file(ocr_structured_file, structured_data)
             
             ocr_file = ocr_structured_file
             
-            # Also directly save the OCR chunks to CSV
+            # Also directly save the OCR chunks to CSV; the rows are buffered and
+            # written once per group of frames
             try:
-                # Create a minimal OCRDataProcessor to use its save_ocr_chunks_to_csv method
-                class MinimalOptions:
-                    """Minimal options class to pass to OCRDataProcessor"""
-                    def __init__(self):
-                        self.verbose = False
-                        self.input_dir = "."  # Default input directory
-                        self.csv_file = "all_frame_embeddings/payloads/csv/frame_chunks.csv"
-                        self.display_data = False
-                        self.use_gemini = True  # Always use Gemini in this context
-                        self.dry_run = True
-                        self.batch_size = 10
-                        self.update_airtable = False
-                        self.flagged_only = False
-                        self.gemini_api_key = os.environ.get("GOOGLE_API_KEY", "")  # Get from environment
-                
-                ocr_processor = OCRDataProcessor(MinimalOptions())
-                chunks_csv = Path(f"{self.storage_dir}/payloads/csv/frame_chunks.csv")
-                ocr_processor.save_ocr_chunks_to_csv(frame_id, structured_data, str(chunks_csv))
-                logger.info(f"Saved OCR chunks directly to CSV for {frame_id}")
+                rows = build_ocr_chunk_rows(frame_id, structured_data)
+                if rows:
+                    with self._chunk_rows_lock:
+                        self._chunk_rows.extend(rows)
+                    logger.info(f"Added {len(rows)} OCR chunks to the chunks CSV buffer for {frame_id}")
+                else:
+                    logger.warning(f"No text content found for chunking in OCR data for {frame_id}")
             except Exception as e:
                 logger.error(f"Error saving OCR chunks directly to CSV: {e}")
                 logger.debug(traceback.format_exc())
         
-        # Generate command to run the chunking script
-        chunk_dir = Path(f"{self.storage_dir}/payloads/chunks/{frame_id}")
+        chunk_dir = self._chunks_dir / frame_id
         os.makedirs(chunk_dir, exist_ok=True)
         
-        cmd = [
-            "python", "scripts/chunk_metadata.py",
-            "--input-file", str(metadata_file),
-            "--output-dir", str(chunk_dir),
-            "--frame-id", frame_id,
-            "--frame-path", str(frame_path)
-        ]
-        
-        if ocr_file and ocr_file.exists():
-            cmd.extend(["--ocr-file", str(ocr_file)])
+        # Run the chunking in-process; chunk_metadata is imported here so a
+        # missing chunking dependency only fails this step, not the pipeline
+        try:
+            from scripts import chunk_metadata
+        except ImportError as e:
+            logger.error(f"Chunking is unavailable for {frame_id}: {str(e)}")
+            return "error"
         
-        # Run the chunking process
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"Error creating chunks for {frame_id}: {result.stderr}")
+            exit_code = chunk_metadata.run(
+                str(metadata_file),
+                str(chunk_dir),
+                frame_id,
+                str(frame_path),
+                ocr_file=str(ocr_file) if ocr_file and ocr_file.exists() else None
+            )
+            if exit_code != 0:
+                logger.error(f"Error creating chunks for {frame_id}")
                 return "error"
             
             logger.info(f"Successfully created chunks for {frame_id}")
@@ -1077,6 +2357,81 @@ class FrameProcessor:
         # This would be a real Airtable update in production
         logger.warning("Not implemented: This would update Airtable in production")
         return "simulated"
+
+class FrameBatchDriver:
+    """
+    Drive a run from the parent process: hand frames to the worker pool and
+    collect their results, Parquet rows and summary. The workers each build
+    their own FrameProcessor; the driver holds none of its resources (Gemini
+    clients, caches, logs or CSV files).
+    """
+    
+    def __init__(self, options):
+        """Initialize the driver with the pipeline options."""
+        self.options = options
+        self.storage_dir = options.storage_dir
+        self.batch_size = options.batch_size
+        self.frames_per_worker = get_frames_per_worker(options)
+        self.processed_count = 0
+        self.error_count = 0
+        
+        # One timestamp names every worker's master log shard of this run
+        # (see scripts/merge_logs.py --run)
+        options.run_timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        logger.info(f"Run timestamp: {options.run_timestamp}")
+        
+        # The results file and Parquet output go under the storage directory
+        _ensure_dirs(self.storage_dir)
+        
+        if options.dry_run:
+            logger.info("Running in DRY RUN mode - no actual updates will be made")
+    
+    def build_parquet_row(self, frame_id: str, frame_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Parquet row for a processed frame (same fields as the frames CSV).
+        
+        Args:
+            frame_id: The ID of the frame
+            frame_data: Complete frame data including OCR
+            
+        Returns:
+            Dictionary matching PARQUET_FRAMES_SCHEMA
+        """
+        structured_data = frame_data.get("structured_data") or {}
+        return {
+            "frame_id": frame_id,
+            "processed_time": datetime.now().isoformat(),
+            "frame_path": frame_data.get("frame_path", ""),
+            "ocr_status": frame_data.get("ocr_status", ""),
+            "ocr_structured": bool(frame_data.get("ocr_structured")),
+            "ocr_data": dumps_json(structured_data) if structured_data else "",
+            "topics": [str(topic) for topic in structured_data.get("topics") or []],
+            "content_types": [str(content_type) for content_type in structured_data.get("content_types") or []],
+            "is_flagged": bool(structured_data.get("contains_sensitive_info", False)),
+            "word_count": to_int(structured_data.get("word_count")),
+            "char_count": to_int(structured_data.get("char_count")),
+            "summary": str(structured_data.get("summary") or "")
+        }
+    
+    def open_parquet_writer(self) -> Optional["pq.ParquetWriter"]:
+        """Open this run's processed frames Parquet file, or None without pyarrow."""
+        if not PYARROW_AVAILABLE:
+            return None
+        
+        parquet_file = Path(f"{self.storage_dir}/payloads/parquet/processed_frames_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.parquet")
+        os.makedirs(parquet_file.parent, exist_ok=True)
+        logger.info(f"Writing processed frames to Parquet: {parquet_file}")
+        return pq.ParquetWriter(str(parquet_file), PARQUET_FRAMES_SCHEMA, compression="zstd")
+    
+    def write_parquet_rows(self, writer: Optional["pq.ParquetWriter"], rows: List[Dict[str, Any]]) -> None:
+        """Write buffered frame rows to the Parquet file as one row group."""
+        if writer is None or not rows:
+            return
+        try:
+            writer.write_table(pa.Table.from_pylist(rows, schema=PARQUET_FRAMES_SCHEMA))
+        except Exception as e:
+            logger.error(f"Error writing {len(rows)} frames to Parquet: {str(e)}")
+        rows.clear()
     
     def process_frames(self, frame_ids: List[str]) -> Dict[str, Any]:
         """
@@ -1093,32 +2448,64 @@ class FrameProcessor:
         
         results = {}
         
-        # Process in batches
-        for i in range(0, len(frame_ids), self.batch_size):
-            batch = frame_ids[i:i+self.batch_size]
-            logger.info(f"Processing batch {i//self.batch_size + 1}/{(len(frame_ids)-1)//self.batch_size + 1} with {len(batch)} frames")
-            
-            # Process batch in parallel
-            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PROCESSES) as executor:
-                future_to_frame = {executor.submit(self.process_single_frame, frame_id): frame_id for frame_id in batch}
+        # Frames that reached the CSV step are also collected into Parquet row groups
+        parquet_writer = self.open_parquet_writer()
+        parquet_rows = []
+        
+        # Frames run in worker processes, each with its own FrameProcessor, so the
+        # Python side of the pipeline (parsing, CSV/log writes) is not GIL-bound.
+        # The pool is the only source of OCR concurrency; each Tesseract run is
+        # limited to one thread (see TESSERACT_ENV).
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=MAX_CONCURRENT_PROCESSES,
+            initializer=_init_frame_worker,
+            initargs=(self.options, multiprocessing.Value('i', 0))
+        ) as executor:
+            # Process in batches
+            for i in range(0, len(frame_ids), self.batch_size):
+                batch = frame_ids[i:i+self.batch_size]
+                logger.info(f"Processing batch {i//self.batch_size + 1}/{(len(frame_ids)-1)//self.batch_size + 1} with {len(batch)} frames")
+                
+                # Process batch in parallel; each worker task is a group of frames
+                # processed concurrently (single frames by default)
+                groups = [batch[j:j+self.frames_per_worker] for j in range(0, len(batch), self.frames_per_worker)]
+                future_to_group = {executor.submit(_process_frames_in_worker, group): group for group in groups}
                 
-                for future in concurrent.futures.as_completed(future_to_frame):
-                    frame_id = future_to_frame[future]
+                for future in concurrent.futures.as_completed(future_to_group):
                     try:
-                        success, frame_data = future.result()
-                        results[frame_id] = frame_data
+                        group_results = future.result()
                     except Exception as e:
-                        logger.error(f"Unhandled exception processing {frame_id}: {str(e)}")
                         traceback.print_exc()
-                        results[frame_id] = {"frame_id": frame_id, "status": "error_unhandled", "error": str(e)}
-                        self.error_count += 1
-            
-            # Log progress after each batch
-            elapsed = time.time() - start_time
-            frames_per_second = (i + len(batch)) / elapsed if elapsed > 0 else float('inf')
-            logger.info(f"Processed {i + len(batch)}/{len(frame_ids)} frames "
-                       f"({(i + len(batch))/len(frame_ids)*100:.1f}%) - "
-                       f"Speed: {frames_per_second:.2f} frames/sec")
+                        for frame_id in future_to_group[future]:
+                            logger.error(f"Unhandled exception processing {frame_id}: {str(e)}")
+                            results[frame_id] = {"frame_id": frame_id, "status": "error_unhandled", "error": str(e)}
+                            self.error_count += 1
+                        continue
+                    
+                    for frame_id, (success, frame_data) in group_results:
+                        results[frame_id] = frame_data
+                        
+                        if parquet_writer is not None and "csv_status" in frame_data:
+                            parquet_rows.append(self.build_parquet_row(frame_id, frame_data))
+                            if len(parquet_rows) >= PARQUET_ROW_GROUP_SIZE:
+                                self.write_parquet_rows(parquet_writer, parquet_rows)
+                        
+                        # Workers count on their own processor instances
+                        if success:
+                            self.processed_count += 1
+                        else:
+                            self.error_count += 1
+                
+                # Log progress after each batch
+                elapsed = time.time() - start_time
+                frames_per_second = (i + len(batch)) / elapsed if elapsed > 0 else float('inf')
+                logger.info(f"Processed {i + len(batch)}/{len(frame_ids)} frames "
+                           f"({(i + len(batch))/len(frame_ids)*100:.1f}%) - "
+                           f"Speed: {frames_per_second:.2f} frames/sec")
+        
+        if parquet_writer is not None:
+            self.write_parquet_rows(parquet_writer, parquet_rows)
+            parquet_writer.close()
         
         # Generate summary
         elapsed = time.time() - start_time
@@ -1133,21 +2520,63 @@ class FrameProcessor:
         logger.info(f"Processing complete: {summary['processed_frames']} processed, {summary['error_frames']} errors")
         logger.info(f"Total time: {elapsed:.2f} seconds, Speed: {summary['frames_per_second']:.2f} frames/sec")
         
-        # Save results
+        # Save results; for large runs this is a multi-MB document, so it is
+        # serialized and written on its own thread while shutdown continues
         results_file = Path(f"{self.storage_dir}/logs/results_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json")
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump({"summary": summary, "results": results}, f, indent=2)
         
-        logger.info(f"Results saved to {results_file}")
+        def save_results():
+            try:
+                write_json_file(results_file, {"summary": summary, "results": results})
+                logger.info(f"Results saved to {results_file}")
+            except Exception as e:
+                logger.error(f"Error saving results to {results_file}: {str(e)}")
+        
+        threading.Thread(target=save_results, name="results-writer").start()
         
         return summary
 
+# Per-process FrameProcessor used by the batch worker processes
+_worker_processor = None
+
+def _init_frame_worker(options, worker_counter) -> None:
+    """Create the FrameProcessor for a batch worker process."""
+    global _worker_processor
+    
+    # Number the workers so they start on different Gemini API keys
+    with worker_counter.get_lock():
+        options.gemini_key_shard = worker_counter.value
+        worker_counter.value += 1
+    
+    _worker_processor = FrameProcessor(options)
+    
+    # Pool workers don't run atexit handlers; this finalizer runs when the
+    # worker shuts down so queued output is written and files are closed
+    multiprocessing.util.Finalize(None, _worker_processor.close, exitpriority=10)
+
+def _process_frames_in_worker(frame_ids: List[str]) -> List[Tuple[str, Tuple[bool, Dict[str, Any]]]]:
+    """
+    Process a group of frames with this worker's FrameProcessor. Frames of a
+    group run on separate threads so their Gemini requests overlap (and can
+    be batched).
+    """
+    try:
+        if len(frame_ids) == 1:
+            return [(frame_ids[0], _worker_processor.process_single_frame(frame_ids[0]))]
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(frame_ids)) as pool:
+            return list(zip(frame_ids, pool.map(_worker_processor.process_single_frame, frame_ids)))
+    finally:
+        # One chunks CSV write per group instead of one per frame
+        _worker_processor.flush_chunk_rows()
+
 def main():
     parser = argparse.ArgumentParser(description="Process frames through the complete pipeline")
     parser.add_argument("--frame-id", help="Single frame ID to process")
     parser.add_argument("--frame-ids-file", help="File containing frame IDs to process (one per line)")
     parser.add_argument("--storage-dir", default=DEFAULT_STORAGE_DIR, help=f"Storage directory (default: {DEFAULT_STORAGE_DIR})")
     parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=f"Batch size for processing (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--frames-per-worker", type=int, default=1, help="Frames each worker process handles concurrently, overlapping their Gemini requests (default: 1)")
+    parser.add_argument("--gemini-batch-size", type=int, default=1, help="Frames analyzed per Gemini request, e.g. 8 when throughput matters more than per-frame latency (default: 1)")
     parser.add_argument("--dry-run", action="store_true", help="Run without making actual Airtable/DB updates")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     
@@ -1173,11 +2602,10 @@ def main():
         frame_ids = [f"test_frame_{i}" for i in range(1, 4)]
         logger.info(f"No frame IDs specified, using test frames: {frame_ids}")
     
-    # Initialize processor
-    processor = FrameProcessor(args)
-    
-    # Process frames
-    processor.process_frames(frame_ids)
+    # Process frames; the workers build the frame processors, the parent
+    # only drives the pool
+    driver = FrameBatchDriver(args)
+    driver.process_frames(frame_ids)
     
     return 0
 
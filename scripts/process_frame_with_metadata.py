@@ -8,10 +8,11 @@ import sys
 import logging
 import argparse
 import asyncio
+import time
 from PIL import Image
 from pathlib import Path
 from io import BytesIO
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from dotenv import load_dotenv
 import pyairtable
 from pyairtable.api import Api
@@ -43,6 +44,23 @@ TECHNICAL_DETAILS_FIELD = 'TechnicalDetails'
 RELATIONSHIP_TO_PREVIOUS_FIELD = 'RelationshipToPrevious'
 STAGE_OF_WORK_FIELD = 'StageOfWork'
 
+# Fields fetched for metadata lookups
+METADATA_FIELDS = [FRAME_ID_FIELD, FRAME_NUMBER_FIELD, FOLDER_NAME_FIELD, FOLDER_PATH_FIELD,
+                   SUMMARY_FIELD, TOOLS_VISIBLE_FIELD, ACTIONS_DETECTED_FIELD,
+                   TECHNICAL_DETAILS_FIELD, RELATIONSHIP_TO_PREVIOUS_FIELD, STAGE_OF_WORK_FIELD]
+
+# Seconds the in-memory copy of the table is used before it is fetched again
+AIRTABLE_INDEX_TTL_SECONDS = 300
+
+def parse_frame_number(filename: str) -> Optional[int]:
+    """Get the frame number from a frame_<number>.<ext> filename, or None."""
+    if filename.startswith('frame_') and '.' in filename:
+        try:
+            return int(filename.split('.')[0].split('_')[1])
+        except (IndexError, ValueError):
+            pass
+    return None
+
 class AirtableMetadataFinder:
     """Class to find and retrieve metadata from Airtable for a frame."""
     
@@ -53,80 +71,128 @@ class AirtableMetadataFinder:
         self.table_name = table_name
         self.api = Api(api_key)
         self.table = self.api.table(base_id, table_name)
+        
+        # In-memory index of the table's records, loaded on the first lookup so
+        # a batch of frames costs one table fetch instead of one or two each
+        self._by_number = {}
+        self._by_folder = {}
+        self._index_loaded_at = None
         logger.info(f"Initialized AirtableMetadataFinder for table {table_name} in base {base_id}")
     
+    def _refresh_index(self) -> None:
+        """Fetch the table and index its records by frame number and folder name, if stale."""
+        if self._index_loaded_at is not None and time.monotonic() - self._index_loaded_at < AIRTABLE_INDEX_TTL_SECONDS:
+            return
+        
+        records = self.table.all(fields=METADATA_FIELDS)
+        by_number = {}
+        by_folder = {}
+        for record in records:
+            fields = record.get('fields', {})
+            try:
+                by_number.setdefault(int(fields.get(FRAME_NUMBER_FIELD)), []).append(record)
+            except (TypeError, ValueError):
+                pass
+            if fields.get(FOLDER_NAME_FIELD) is not None:
+                by_folder.setdefault(fields[FOLDER_NAME_FIELD], []).append(record)
+        
+        self._by_number = by_number
+        self._by_folder = by_folder
+        self._index_loaded_at = time.monotonic()
+        logger.info(f"Loaded {len(records)} Airtable records into the metadata index")
+    
     def find_record_by_frame_path(self, frame_path: str) -> Optional[Dict[str, Any]]:
         """Find an Airtable record that matches the given frame path."""
         frame_file = Path(frame_path)
         filename = frame_file.name
         dir_name = frame_file.parent.name
-        frame_num = None
         
         # Try to extract frame number from filename
-        if filename.startswith('frame_') and '.' in filename:
-            try:
-                frame_num = int(filename.split('.')[0].split('_')[1])
-            except (IndexError, ValueError):
-                logger.warning(f"Couldn't extract frame number from filename: {filename}")
+        frame_num = parse_frame_number(filename)
+        if frame_num is None and filename.startswith('frame_') and '.' in filename:
+            logger.warning(f"Couldn't extract frame number from filename: {filename}")
         
         logger.info(f"Looking for metadata for frame: {filename} (number: {frame_num})")
         
         try:
-            # Method 1: Match by frame number (most reliable based on testing)
-            if frame_num is not None:
-                logger.info(f"Searching by frame number: {frame_num}")
-                records = self.table.all(
-                    fields=[FRAME_ID_FIELD, FRAME_NUMBER_FIELD, FOLDER_NAME_FIELD, FOLDER_PATH_FIELD, 
-                            SUMMARY_FIELD, TOOLS_VISIBLE_FIELD, ACTIONS_DETECTED_FIELD, 
-                            TECHNICAL_DETAILS_FIELD, RELATIONSHIP_TO_PREVIOUS_FIELD, STAGE_OF_WORK_FIELD],
-                    formula=f"{{{FRAME_NUMBER_FIELD}}} = {frame_num}"
-                )
-                
-                if records:
-                    if len(records) > 1:
-                        # If multiple records with same frame number, try to narrow by folder name
-                        logger.info(f"Found {len(records)} records with frame number {frame_num}, trying to narrow by folder name")
-                        for record in records:
-                            fields = record.get('fields', {})
-                            if dir_name == fields.get(FOLDER_NAME_FIELD):
-                                logger.info(f"Found exact match with folder name: {dir_name}")
-                                return record
-                        
-                        # If no exact folder match, return the first record
-                        logger.info(f"No exact folder match, using first record with frame number {frame_num}")
-                        return records[0]
-                    else:
-                        logger.info(f"Found single record with frame number {frame_num}")
-                        return records[0]
-            
-            # Method 2: Try matching on folder name as fallback
-            logger.info(f"Searching by folder name: {dir_name}")
-            records = self.table.all(
-                fields=[FRAME_ID_FIELD, FRAME_NUMBER_FIELD, FOLDER_NAME_FIELD, FOLDER_PATH_FIELD,
-                        SUMMARY_FIELD, TOOLS_VISIBLE_FIELD, ACTIONS_DETECTED_FIELD,
-                        TECHNICAL_DETAILS_FIELD, RELATIONSHIP_TO_PREVIOUS_FIELD, STAGE_OF_WORK_FIELD],
-                formula=f"{{{FOLDER_NAME_FIELD}}} = '{dir_name}'"
-            )
-            
-            if records:
-                # If we found records by folder, try to find the specific frame number
-                if frame_num is not None:
-                    for record in records:
-                        fields = record.get('fields', {})
-                        record_frame_num = fields.get(FRAME_NUMBER_FIELD)
-                        if record_frame_num == frame_num or record_frame_num == str(frame_num):
-                            logger.info(f"Found matching frame {frame_num} in folder {dir_name}")
-                            return record
-                
-                logger.warning(f"No exact frame match in folder {dir_name}")
-                return None
-            
-            logger.warning(f"No matching records found for frame {filename} in folder {dir_name}")
+            self._refresh_index()
+        except Exception as e:
+            logger.error(f"Error searching Airtable: {e}")
             return None
+        
+        return self._match_record(frame_num, dir_name)
+    
+    def find_records_bulk(self, frame_paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Find the Airtable records of many frames at once, matched like
+        find_record_by_frame_path but without per-frame logging.
+        
+        Args:
+            frame_paths: Paths of the frame image files
             
+        Returns:
+            Dictionary mapping each frame path to its record, or None if no
+            record matches or Airtable could not be searched
+        """
+        try:
+            self._refresh_index()
         except Exception as e:
             logger.error(f"Error searching Airtable: {e}")
-            return None
+            return {frame_path: None for frame_path in frame_paths}
+        
+        results = {}
+        for frame_path in frame_paths:
+            frame_file = Path(frame_path)
+            results[frame_path] = self._match_record(
+                parse_frame_number(frame_file.name), frame_file.parent.name, quiet=True
+            )
+        
+        found = sum(record is not None for record in results.values())
+        logger.info(f"Found metadata for {found} of {len(frame_paths)} frames")
+        return results
+    
+    def _match_record(self, frame_num: Optional[int], dir_name: str, quiet: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Pick a frame's record from the index, preferring the frame's folder.
+        With quiet set, the search steps are only logged at debug level.
+        """
+        log_info = logger.debug if quiet else logger.info
+        log_warning = logger.debug if quiet else logger.warning
+        
+        # Method 1: Match by frame number (most reliable based on testing)
+        if frame_num is not None:
+            log_info(f"Searching by frame number: {frame_num}")
+            records = self._by_number.get(frame_num, [])
+            
+            if len(records) > 1:
+                # If multiple records with same frame number, try to narrow by folder name
+                log_info(f"Found {len(records)} records with frame number {frame_num}, trying to narrow by folder name")
+                for record in records:
+                    if record.get('fields', {}).get(FOLDER_NAME_FIELD) == dir_name:
+                        log_info(f"Found exact match with folder name: {dir_name}")
+                        return record
+                
+                # If no exact folder match, return the first record
+                log_info(f"No exact folder match, using first record with frame number {frame_num}")
+                return records[0]
+            if records:
+                log_info(f"Found single record with frame number {frame_num}")
+                return records[0]
+        
+        # Method 2: Try matching on folder name as fallback
+        log_info(f"Searching by folder name: {dir_name}")
+        records = self._by_folder.get(dir_name, [])
+        if frame_num is not None:
+            for record in records:
+                if record.get('fields', {}).get(FRAME_NUMBER_FIELD) in (frame_num, str(frame_num)):
+                    log_info(f"Found matching frame {frame_num} in folder {dir_name}")
+                    return record
+        
+        if records:
+            log_warning(f"No exact frame match in folder {dir_name}")
+        else:
+            log_warning(f"No matching records found for frame {frame_num} in folder {dir_name}")
+        return None
 
 async def process_frame(frame_path: str, metadata: Dict[str, Any]) -> bool:
     """
@@ -170,42 +236,53 @@ async def process_frame(frame_path: str, metadata: Dict[str, Any]) -> bool:
         logger.error(f"Error processing frame: {e}")
         return False
 
-async def main(frame_path: str):
+async def main(frame_paths: List[str]):
     """Main entry point for the script."""
     if not all([AIRTABLE_TOKEN, AIRTABLE_BASE_ID, AIRTABLE_TABLE_NAME]):
         logger.error("Missing required Airtable configuration in environment variables.")
         sys.exit(1)
     
-    # Check if frame exists
-    if not os.path.exists(frame_path):
-        logger.error(f"Frame file not found: {frame_path}")
+    # Check if the frames exist
+    missing = [frame_path for frame_path in frame_paths if not os.path.exists(frame_path)]
+    if missing:
+        for frame_path in missing:
+            logger.error(f"Frame file not found: {frame_path}")
         sys.exit(1)
     
-    # Find metadata for the frame
+    # Find metadata for the frames; several frames are matched against one
+    # fetch of the table
     metadata_finder = AirtableMetadataFinder(AIRTABLE_TOKEN, AIRTABLE_BASE_ID, AIRTABLE_TABLE_NAME)
-    record = metadata_finder.find_record_by_frame_path(frame_path)
-    
-    if not record:
-        logger.error(f"No metadata found for frame: {frame_path}")
-        sys.exit(1)
-    
-    # Extract fields from the record
-    metadata = record.get('fields', {})
-    logger.info(f"Found metadata for frame with ID: {record.get('id')}")
+    if len(frame_paths) == 1:
+        records = {frame_paths[0]: metadata_finder.find_record_by_frame_path(frame_paths[0])}
+    else:
+        records = metadata_finder.find_records_bulk(frame_paths)
     
-    # Process the frame with its metadata
-    success = await process_frame(frame_path, metadata)
+    failed = 0
+    for frame_path in frame_paths:
+        record = records.get(frame_path)
+        if not record:
+            logger.error(f"No metadata found for frame: {frame_path}")
+            failed += 1
+            continue
+        
+        # Extract fields from the record
+        metadata = record.get('fields', {})
+        logger.info(f"Found metadata for frame with ID: {record.get('id')}")
+        
+        # Process the frame with its metadata
+        if not await process_frame(frame_path, metadata):
+            failed += 1
     
-    if success:
+    if not failed:
         logger.info("✅ Frame processing completed successfully!")
         sys.exit(0)
     else:
-        logger.error("❌ Frame processing failed.")
+        logger.error(f"❌ Frame processing failed for {failed} of {len(frame_paths)} frames.")
         sys.exit(1)
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description='Process a frame with its Airtable metadata')
-    parser.add_argument('frame_path', help='Path to the frame image file')
+    parser = argparse.ArgumentParser(description='Process frames with their Airtable metadata')
+    parser.add_argument('frame_paths', nargs='+', help='Paths to the frame image files')
     args = parser.parse_args()
     
-    asyncio.run(main(args.frame_path)) 
\ No newline at end of file
+    asyncio.run(main(args.frame_paths))
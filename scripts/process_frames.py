@@ -20,6 +20,13 @@ from dotenv import load_dotenv
 # Import project modules
 from src.processors.batch_processor import process_directory
 
+# Optional: libuv-based event loop for the network-bound async work
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -48,6 +55,8 @@ async def main():
     processing_group.add_argument("--max-chunks", type=int, default=None, help="Maximum number of chunks per frame")
     processing_group.add_argument("--sequential", action="store_true", help="Process files sequentially")
     processing_group.add_argument("--concurrency", type=int, default=4, help="Maximum number of concurrent processes (default: 4)")
+    processing_group.add_argument("--embedding-cache", default=None, help="SQLite file caching embeddings by content hash across runs")
+    processing_group.add_argument("--embed-batch-size", type=int, default=32, help="Maximum texts per embedding request (default: 32)")
     
     # Storage options
     storage_group = parser.add_argument_group("Storage Options")
@@ -76,7 +85,9 @@ async def main():
         save_to_airtable=not args.no_airtable and not args.local_only,
         save_to_postgres=not args.no_postgres and not args.local_only,
         use_webhook=args.webhook and not args.local_only,
-        use_test_webhook=not args.production_webhook
+        use_test_webhook=not args.production_webhook,
+        embedding_cache_path=args.embedding_cache,
+        embed_batch_size=args.embed_batch_size
     )
     
     # Print summary
@@ -92,4 +103,7 @@ async def main():
     return 0 if results.get('failed', 0) == 0 else 1
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    
     asyncio.run(main()) 
\ No newline at end of file
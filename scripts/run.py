@@ -17,6 +17,13 @@ os.makedirs('logs', exist_ok=True)
 # Import the application
 from src.main import run, app, verify_config, debug_config, logger
 
+# Optional: libuv-based event loop for the network-bound async work
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Define command-line arguments
 parser = argparse.ArgumentParser(description='Start the TheLogicLoomDB application.')
 parser.add_argument('--debug', action='store_true', help='Enable debug mode')
@@ -73,4 +80,7 @@ if args.debug:
 # Run the application
 if __name__ == "__main__":
     logger.info("Starting TheLogicLoomDB application")
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    
     asyncio.run(run()) 
\ No newline at end of file
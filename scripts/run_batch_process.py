@@ -5,6 +5,7 @@ Script to run a small batch processing job to test the pipeline.
 import os
 import sys
 import asyncio
+import argparse
 import logging
 from dotenv import load_dotenv
 from src.integrations.google_drive import GoogleDriveClient
@@ -13,6 +14,13 @@ from src.integrations.batch_processor import BatchProcessor
 from PIL import Image
 from io import BytesIO
 
+# Optional: libuv-based event loop for the network-bound async work
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,12 +34,13 @@ load_dotenv()
 # Simple dummy processor function for testing
 async def dummy_process_frame(image, metadata):
     """Dummy processor that just logs information about the frame."""
-    logger.info(f"Processing frame: {metadata.get('frame_number')} from video {metadata.get('video_id')}")
-    logger.info(f"Image size: {image.size}, format: {image.format}")
-    logger.info(f"Metadata: {metadata}")
+    logger.info(f"Processed frame {metadata.get('frame_number')} from video {metadata.get('video_id')}")
+    # Only format the full metadata when debug output is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Image size: {image.size}, format: {image.format}, metadata: {metadata}")
     return True
 
-async def run_batch_test():
+async def run_batch_test(concurrency=2):
     """Run a small batch processing job to test the pipeline."""
     try:
         # Initialize clients
@@ -53,7 +62,8 @@ async def run_batch_test():
         result = await processor.process_batch(
             batch_size=2,  # Process just 2 frames
             max_batches=1,  # Just one batch
-            update_airtable=False  # Don't update Airtable (to avoid marking as processed)
+            update_airtable=False,  # Don't update Airtable (to avoid marking as processed)
+            max_workers=concurrency  # Frames in flight at once
         )
         
         # Print results
@@ -72,8 +82,17 @@ async def run_batch_test():
 if __name__ == "__main__":
     print("🔍 Testing batch processing pipeline...")
     
+    # Get concurrency from command line if provided
+    parser = argparse.ArgumentParser(description="Test the batch processing pipeline")
+    parser.add_argument("--concurrency", type=int, default=2,
+                        help="Number of frames to process at once (default: 2)")
+    args = parser.parse_args()
+    
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    
     # Run the async test
-    success = asyncio.run(run_batch_test())
+    success = asyncio.run(run_batch_test(args.concurrency))
     
     if success:
         print("✅ Batch processing test successful!")
@@ -5,6 +5,7 @@ Script to run sequential processing of frames, sorted by folder path.
 import os
 import sys
 import asyncio
+import argparse
 import logging
 from dotenv import load_dotenv
 from src.integrations.google_drive import GoogleDriveClient
@@ -13,6 +14,13 @@ from src.integrations.sequential_processor import SequentialProcessor
 from PIL import Image
 from io import BytesIO
 
+# Optional: libuv-based event loop for the network-bound async work
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,12 +35,13 @@ load_dotenv()
 async def dummy_process_frame(image, metadata):
     """Dummy processor that just logs information about the frame."""
     folder_path = metadata.get('FolderPath', 'Unknown Folder')
-    logger.info(f"Processing frame from folder: {folder_path}")
-    logger.info(f"Frame: {metadata.get('frame_number')} from video {metadata.get('video_id')}")
-    logger.info(f"Image size: {image.size}, format: {image.format}")
+    logger.info(f"Processed {folder_path}/{metadata.get('frame_number')}")
+    # Only format the details when debug output is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Video: {metadata.get('video_id')}, image size: {image.size}, format: {image.format}")
     return True
 
-async def run_sequential_test(max_frames=5):
+async def run_sequential_test(max_frames=5, concurrency=1):
     """Run sequential processing test, limited to a few frames."""
     try:
         # Initialize clients
@@ -54,7 +63,8 @@ async def run_sequential_test(max_frames=5):
         result = await processor.process_frames(
             max_frames=max_frames,  # Process just a few frames
             update_airtable=False,  # Don't update Airtable (to avoid marking as processed)
-            folder_path_field="FolderPath"  # Field to sort by
+            folder_path_field="FolderPath",  # Field to sort by
+            max_concurrent=concurrency  # Frames in flight at once
         )
         
         # Print results
@@ -73,16 +83,19 @@ async def run_sequential_test(max_frames=5):
 if __name__ == "__main__":
     print("🔍 Testing sequential processing pipeline...")
     
-    # Get max frames from command line if provided
-    max_frames = 5
-    if len(sys.argv) > 1:
-        try:
-            max_frames = int(sys.argv[1])
-        except ValueError:
-            print(f"Invalid max_frames value. Using default: {max_frames}")
+    # Get max frames and concurrency from command line if provided
+    parser = argparse.ArgumentParser(description="Test the sequential processing pipeline")
+    parser.add_argument("max_frames", nargs="?", type=int, default=5,
+                        help="Maximum number of frames to process (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Number of frames to process at once (default: 1)")
+    args = parser.parse_args()
+    
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
     
     # Run the async test
-    success = asyncio.run(run_sequential_test(max_frames))
+    success = asyncio.run(run_sequential_test(args.max_frames, args.concurrency))
     
     if success:
         print("✅ Sequential processing test successful!")
@@ -11,6 +11,13 @@ import asyncpg
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+# Optional: libuv-based event loop for the network-bound async work
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -32,30 +39,65 @@ try:
 except Exception as e:
     logger.error(f"Error loading environment: {e}")
 
-async def get_connection():
-    """Get a database connection."""
-    # Get connection parameters from environment
-    host = os.getenv('POSTGRES_HOST')
-    port = os.getenv('POSTGRES_PORT')
-    database = os.getenv('POSTGRES_DB')
-    user = os.getenv('POSTGRES_USER')
-    password = os.getenv('POSTGRES_PASS')
-    
-    # Check if all parameters are available
-    if not all([host, port, database, user, password]):
-        logger.error("Incomplete PostgreSQL connection information")
+# PostgreSQL DSN, built from the environment on first use
+_DSN = None
+
+def get_dsn() -> Optional[str]:
+    """Build the PostgreSQL DSN from the environment once and reuse it."""
+    global _DSN
+    if _DSN is None:
+        # Get connection parameters from environment
+        host = os.getenv('POSTGRES_HOST')
+        port = os.getenv('POSTGRES_PORT')
+        database = os.getenv('POSTGRES_DB')
+        user = os.getenv('POSTGRES_USER')
+        password = os.getenv('POSTGRES_PASS')
+        
+        # Check if all parameters are available
+        if not all([host, port, database, user, password]):
+            logger.error("Incomplete PostgreSQL connection information")
+            return None
+        
+        _DSN = f"postgres://{user}:{password}@{host}:{port}/{database}"
+    return _DSN
+
+async def get_pool():
+    """Get a database connection pool."""
+    dsn = get_dsn()
+    if not dsn:
         return None
     
     try:
-        # Create connection
-        dsn = f"postgres://{user}:{password}@{host}:{port}/{database}"
-        conn = await asyncpg.connect(dsn=dsn)
-        logger.info(f"Connected to PostgreSQL database at {host}:{port}/{database}")
-        return conn
+        # Create pool
+        pool = await asyncpg.create_pool(dsn=dsn, min_size=2, max_size=8, command_timeout=300)
+        logger.info(f"Connected to PostgreSQL database at {dsn.rsplit('@', 1)[1]}")
+        return pool
     except Exception as e:
         logger.error(f"Error connecting to database: {e}")
         return None
 
+def updated_row_count(status: str) -> int:
+    """Get the row count from a command status such as "UPDATE 42"."""
+    try:
+        return int(status.split()[-1])
+    except (AttributeError, IndexError, ValueError):
+        return 0
+
+# Indexes backing the reference_id UPDATE joins, as (name, table, columns)
+REFERENCE_ID_INDEXES = [
+    ("idx_fdf_frame_id", "metadata.frame_details_full", "frame_id"),
+    ("idx_fdc_chunk_id", "metadata.frame_details_chunk", "chunk_id"),
+    ("idx_mm_refid_type", "embeddings.multimodal_embeddings", "reference_type, reference_id"),
+]
+
+async def ensure_reference_id_indexes(conn):
+    """Create the indexes used by the reference_id updates if they are missing."""
+    for index_name, table, columns in REFERENCE_ID_INDEXES:
+        try:
+            await conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})")
+        except Exception as e:
+            logger.warning(f"Could not create index {index_name} on {table}: {e}")
+
 async def update_frame_reference_ids(conn):
     """Update reference_ids in frame_details_full to include folder name."""
     try:
@@ -72,35 +114,17 @@ async def update_frame_reference_ids(conn):
             logger.error("Table metadata.frame_details_full does not exist")
             return False
         
-        # Get all frames with their folder names
-        frames = await conn.fetch("""
-        SELECT f.id, f.frame_name, f.folder_name, fdf.reference_id
+        # Set every frame's reference_id to "folder_name/frame_name" in one
+        # statement, touching only rows whose reference_id differs
+        result = await conn.execute("""
+        UPDATE metadata.frame_details_full fdf
+        SET reference_id = COALESCE(f.folder_name, 'unknown_folder') || '/' || f.frame_name,
+            updated_at = CURRENT_TIMESTAMP
         FROM content.frames f
-        JOIN metadata.frame_details_full fdf ON f.id = fdf.frame_id
+        WHERE fdf.frame_id = f.id
+        AND fdf.reference_id IS DISTINCT FROM COALESCE(f.folder_name, 'unknown_folder') || '/' || f.frame_name
         """)
-        
-        logger.info(f"Found {len(frames)} frames to update reference_ids")
-        
-        # Update each frame's reference_id
-        updated_count = 0
-        for frame in frames:
-            frame_id = frame['id']
-            frame_name = frame['frame_name']
-            folder_name = frame['folder_name'] or "unknown_folder"
-            current_ref_id = frame['reference_id']
-            
-            # Create new reference_id in the format "folder_name/frame_name"
-            new_ref_id = f"{folder_name}/{frame_name}"
-            
-            # Only update if different
-            if current_ref_id != new_ref_id:
-                await conn.execute("""
-                UPDATE metadata.frame_details_full
-                SET reference_id = $1, 
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE frame_id = $2
-                """, new_ref_id, frame_id)
-                updated_count += 1
+        updated_count = updated_row_count(result)
         
         logger.info(f"Updated {updated_count} frame reference_ids in frame_details_full")
         
@@ -139,39 +163,19 @@ async def update_chunk_reference_ids(conn):
             logger.error("Table metadata.frame_details_chunk does not exist")
             return False
         
-        # Get all chunks with their frame and folder information
-        chunks = await conn.fetch("""
-        SELECT c.id, c.frame_id, c.chunk_sequence_id, 
-               f.frame_name, f.folder_name, fdc.reference_id,
-               fdc.chunk_id
+        # Set every chunk's reference_id to "folder_name/frame_name/chunk_<sequence>"
+        # in one statement, touching only rows whose reference_id differs
+        result = await conn.execute("""
+        UPDATE metadata.frame_details_chunk fdc
+        SET reference_id = COALESCE(f.folder_name, 'unknown_folder') || '/' || f.frame_name || '/chunk_' || c.chunk_sequence_id,
+            updated_at = CURRENT_TIMESTAMP
         FROM content.chunks c
         JOIN content.frames f ON c.frame_id = f.id
-        JOIN metadata.frame_details_chunk fdc ON c.id = fdc.chunk_id
+        WHERE fdc.chunk_id = c.id
+        AND fdc.reference_id IS DISTINCT FROM
+            COALESCE(f.folder_name, 'unknown_folder') || '/' || f.frame_name || '/chunk_' || c.chunk_sequence_id
         """)
-        
-        logger.info(f"Found {len(chunks)} chunks to update reference_ids")
-        
-        # Update each chunk's reference_id
-        updated_count = 0
-        for chunk in chunks:
-            chunk_id = chunk['chunk_id']
-            frame_name = chunk['frame_name']
-            folder_name = chunk['folder_name'] or "unknown_folder"
-            chunk_sequence_id = chunk['chunk_sequence_id']
-            current_ref_id = chunk['reference_id']
-            
-            # Create new reference_id in the format "folder_name/frame_name/chunk_sequence_id"
-            new_ref_id = f"{folder_name}/{frame_name}/chunk_{chunk_sequence_id}"
-            
-            # Only update if different
-            if current_ref_id != new_ref_id:
-                await conn.execute("""
-                UPDATE metadata.frame_details_chunk
-                SET reference_id = $1,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE chunk_id = $2
-                """, new_ref_id, chunk_id)
-                updated_count += 1
+        updated_count = updated_row_count(result)
         
         logger.info(f"Updated {updated_count} chunk reference_ids in frame_details_chunk")
         
@@ -195,40 +199,53 @@ async def update_chunk_reference_ids(conn):
         logger.error(f"Error updating chunk reference_ids: {e}")
         return False
 
+async def run_update(conn, update):
+    """Run one reference_id update in its own bulk-load transaction."""
+    async with conn.transaction():
+        # This is a re-runnable bulk rewrite, so skip waiting on the WAL
+        # flush at commit and give the large hash joins more memory
+        await conn.execute("SET LOCAL synchronous_commit = OFF")
+        await conn.execute("SET LOCAL work_mem = '256MB'")
+        return await update(conn)
+
 async def main():
     """Main function to update reference_ids."""
     logger.info("Starting reference_id update process")
     
-    # Get database connection
-    conn = await get_connection()
-    if not conn:
+    # Get database connection pool
+    pool = await get_pool()
+    if not pool:
         logger.error("Could not connect to database. Update aborted.")
         return
     
     try:
-        # Start a transaction
-        async with conn.transaction():
-            # Update frame reference_ids
-            frame_success = await update_frame_reference_ids(conn)
-            if not frame_success:
-                logger.error("Failed to update frame reference_ids")
-                return
-            
-            # Update chunk reference_ids
-            chunk_success = await update_chunk_reference_ids(conn)
-            if not chunk_success:
-                logger.error("Failed to update chunk reference_ids")
-                return
+        async with pool.acquire() as conn, pool.acquire() as chunk_conn:
+            # Make sure the UPDATE joins can use index lookups
+            await ensure_reference_id_indexes(conn)
             
+            # Frames and chunks touch disjoint rows, so update them concurrently
+            frame_success, chunk_success = await asyncio.gather(
+                run_update(conn, update_frame_reference_ids),
+                run_update(chunk_conn, update_chunk_reference_ids)
+            )
+        
+        if not frame_success:
+            logger.error("Failed to update frame reference_ids")
+        if not chunk_success:
+            logger.error("Failed to update chunk reference_ids")
+        if frame_success and chunk_success:
             logger.info("Successfully updated all reference_ids")
     
     except Exception as e:
         logger.error(f"Error during update process: {e}")
     
     finally:
-        # Close connection
-        await conn.close()
-        logger.info("Database connection closed")
+        # Close connection pool
+        await pool.close()
+        logger.info("Database connection pool closed")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    
+    asyncio.run(main())
@@ -21,18 +21,28 @@ import voyageai
 
 import dotenv
 
+from src.embeddings.embedding_cache import EmbeddingCache
+
 # Load environment variables
 dotenv.load_dotenv()
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# How long a partial batch waits for more texts before it is sent anyway
+EMBED_BATCH_MAX_WAIT_MS = 20
+
+# Embedding requests one ChunkEmbedder keeps in flight at once
+MAX_CONCURRENT_EMBED_REQUESTS = 4
+
 class ChunkEmbedder:
     """
     Client for generating text embeddings using Voyage API.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "voyage-multimodal-3", use_key_rotation: bool = False):
+    def __init__(self, api_key: Optional[str] = None, model: str = "voyage-multimodal-3", use_key_rotation: bool = False,
+                 cache: Optional[EmbeddingCache] = None, embed_batch_size: int = 1,
+                 max_wait_ms: float = EMBED_BATCH_MAX_WAIT_MS):
         """
         Initialize the Voyage embedding client.
         
@@ -40,6 +50,10 @@ class ChunkEmbedder:
             api_key: Voyage API key (default: from env var VOYAGE_API_KEY)
             model: Model name for embeddings (default: voyage-multimodal-3)
             use_key_rotation: Whether to use API key rotation for rate limiting
+            cache: Optional persistent cache so unchanged content is not re-embedded
+            embed_batch_size: Maximum texts per embedding request; concurrent
+                              embed_text calls are grouped up to this size (1 disables batching)
+            max_wait_ms: How long a partial batch waits for more texts before it is sent
         """
         self.api_key = api_key or os.getenv("VOYAGE_API_KEY")
         if not self.api_key:
@@ -56,6 +70,18 @@ class ChunkEmbedder:
         self.min_api_interval = 0.2  # 5 requests per second max
         self.last_api_calls = {}  # Track last API call time for each key
         self.use_key_rotation = use_key_rotation  # Whether to use key rotation
+        self.cache = cache
+        
+        # Dynamic batching: texts waiting for the next request, each with the
+        # future its caller is awaiting
+        self.embed_batch_size = max(1, embed_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self._pending = []
+        self._flush_handle = None
+        # Batch requests in flight, referenced until they finish
+        self._batch_tasks = set()
+        # Created on first use so it belongs to the running event loop
+        self._request_slots = None
         
         logger.info(f"Initialized ChunkEmbedder with model {model}")
     
@@ -72,6 +98,10 @@ class ChunkEmbedder:
         """
         Generate embedding for text.
         
+        With embed_batch_size > 1 the text is grouped with other concurrent
+        calls into one request, sent once the batch is full or max_wait_ms
+        has passed.
+        
         Args:
             text: Text to embed
             retry_count: Number of retries for API calls
@@ -83,30 +113,103 @@ class ChunkEmbedder:
             logger.warning("Empty text provided for embedding")
             return []
         
+        # Reuse the embedding from a previous run when the text is unchanged
+        content_hash = None
+        if self.cache:
+            content_hash = self.cache.content_hash(text)
+            cached = self.cache.get(content_hash, self.model)
+            if cached is not None:
+                logger.debug("Using cached embedding")
+                return cached
+        
+        if self.embed_batch_size > 1:
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((text, retry_count, future))
+            if len(self._pending) >= self.embed_batch_size:
+                self._flush_pending()
+            elif self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.max_wait_ms / 1000, self._flush_pending
+                )
+            embedding = await future
+        else:
+            embeddings = await self._request_embeddings([text], retry_count)
+            embedding = embeddings[0] if embeddings else []
+        
+        if embedding and content_hash:
+            self.cache.put(content_hash, self.model, embedding)
+        return embedding
+    
+    def _flush_pending(self):
+        """Send the texts waiting for a batch as one request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send_pending_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _send_pending_batch(self, batch: List[Tuple[str, int, "asyncio.Future"]]):
+        """Embed a batch of waiting texts and resolve each caller's future."""
+        # Repeated texts (e.g. identical chunks of duplicate frames) are only
+        # embedded once and the vector is shared with every caller
+        unique_texts = list(dict.fromkeys(text for text, _, _ in batch))
+        # Honour the most patient caller's retry budget for the shared request
+        retry_count = max(retries for _, retries, _ in batch)
+        try:
+            embeddings = await self._request_embeddings(unique_texts, retry_count)
+        except Exception as e:
+            logger.error(f"Error embedding batch of {len(unique_texts)} texts: {str(e)}")
+            embeddings = []
+        
+        embedding_by_text = dict(zip(unique_texts, embeddings))
+        for text, _, future in batch:
+            if not future.done():
+                future.set_result(embedding_by_text.get(text, []))
+    
+    async def _request_embeddings(self, texts: List[str], retry_count: int = 3) -> List[List[float]]:
+        """
+        Embed one or more texts with a single API request.
+        
+        Args:
+            texts: Texts to embed
+            retry_count: Number of retries for API calls
+            
+        Returns:
+            Embedding vectors in the order of texts, or an empty list on failure
+        """
         session = await self._ensure_session()
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_EMBED_REQUESTS)
         
         # Payload for embedding API
         payload = {
             "model": self.model,
-            "input": text,
+            "input": texts[0] if len(texts) == 1 else texts,
         }
         
         error = None
-        embedding = []
+        embeddings = []
         
         # Try with retries
         for attempt in range(retry_count):
             try:
-                async with session.post(self.embedding_url, json=payload) as response:
+                # Bound the requests in flight so many concurrent callers
+                # don't turn into a burst of simultaneous API calls
+                async with self._request_slots, session.post(self.embedding_url, json=payload) as response:
                     if response.status == 200:
                         # Parse the response
                         result = await response.json()
                         
-                        if "data" in result and len(result["data"]) > 0:
-                            # Extract the embedding from the response
-                            embedding = result["data"][0]["embedding"]
-                            logger.debug(f"Generated embedding with dimension {len(embedding)}")
-                            return embedding
+                        if "data" in result and len(result["data"]) == len(texts):
+                            # Extract the embeddings from the response, in input order
+                            data = sorted(result["data"], key=lambda item: item.get("index", 0))
+                            embeddings = [item["embedding"] for item in data]
+                            logger.debug(f"Generated {len(embeddings)} embeddings with dimension {len(embeddings[0])}")
+                            return embeddings
                         else:
                             error = f"Unexpected response format: {result}"
                     else:
@@ -122,7 +225,7 @@ class ChunkEmbedder:
             except Exception as e:
                 error = f"Request error: {str(e)}"
             
-            if embedding:
+            if embeddings:
                 break
                 
             if attempt < retry_count - 1:
@@ -130,10 +233,10 @@ class ChunkEmbedder:
                 logger.warning(f"Retry {attempt+1}/{retry_count} after error: {error}. Waiting {wait_time}s")
                 await asyncio.sleep(wait_time)
         
-        if not embedding:
-            logger.error(f"Failed to generate embedding after {retry_count} attempts: {error}")
+        if not embeddings:
+            logger.error(f"Failed to generate embeddings after {retry_count} attempts: {error}")
             
-        return embedding
+        return embeddings
     
     async def embed_batch(self, texts: List[str], batch_size: int = 10) -> List[List[float]]:
         """
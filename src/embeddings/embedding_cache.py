@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Persistent embedding cache keyed by content hash and model name.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import List, Optional, Union
+
+import numpy as np
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class EmbeddingCache:
+    """
+    SQLite cache mapping the SHA-256 of embedded content to its embedding vector.
+    
+    Entries are keyed by (hash, model) so switching embedding models never
+    returns a vector from another model.
+    """
+    
+    def __init__(self, db_path: str):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            db_path: Path to the SQLite cache file
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                vec BLOB NOT NULL,
+                PRIMARY KEY (hash, model)
+            )
+            """)
+            self.conn.commit()
+        
+        logger.info(f"Using embedding cache at {db_path}")
+    
+    @staticmethod
+    def content_hash(content: Union[str, bytes]) -> str:
+        """Return the cache key for a text or raw bytes (such as image data)."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
+    
+    def get(self, content_hash: str, model: str) -> Optional[List[float]]:
+        """
+        Look up a cached embedding.
+        
+        Args:
+            content_hash: Hash from content_hash()
+            model: Embedding model name
+        
+        Returns:
+            The embedding vector, or None on a cache miss
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT vec FROM cache WHERE hash = ? AND model = ?",
+                (content_hash, model)
+            ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32).tolist()
+    
+    def put(self, content_hash: str, model: str, embedding: List[float]):
+        """
+        Store an embedding.
+        
+        Args:
+            content_hash: Hash from content_hash()
+            model: Embedding model name
+            embedding: Embedding vector
+        """
+        vec = np.asarray(embedding, dtype=np.float32).tobytes()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (hash, model, vec) VALUES (?, ?, ?)",
+                (content_hash, model, vec)
+            )
+            self.conn.commit()
+    
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self.conn.close()
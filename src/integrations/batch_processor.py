@@ -91,10 +91,12 @@ class BatchProcessor:
     async def process_batch(self, batch_size: int = BATCH_SIZE, 
                            max_batches: Optional[int] = None,
                            processed_field: str = PROCESSED_FIELD,
-                           update_airtable: bool = True) -> Dict[str, Any]:
+                           update_airtable: bool = True,
+                           max_workers: int = MAX_WORKERS) -> Dict[str, Any]:
         """
         Process a batch of frames from Airtable.
-        Fetches records, processes them concurrently, and updates status.
+        Fetches records, processes them concurrently (up to max_workers at a
+        time), and updates status.
         """
         start_time = time.time()
         total_processed = 0
@@ -127,7 +129,7 @@ class BatchProcessor:
             
             # Process frames concurrently
             loop = asyncio.get_running_loop()
-            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
                 # Pass necessary clients/objects to the processing function
                 # Use partial to pre-fill arguments for the synchronous function
                 process_func = partial(self._process_single_item_sync, 
@@ -336,7 +338,8 @@ class BatchProcessor:
     async def process_all(self, batch_size: int = None, 
                          max_frames: Optional[int] = None,
                          processed_field: str = None,
-                         update_airtable: bool = True) -> Dict[str, Any]:
+                         update_airtable: bool = True,
+                         max_workers: int = MAX_WORKERS) -> Dict[str, Any]:
         """
         Process all unprocessed frames, potentially in multiple batches.
         
@@ -345,6 +348,7 @@ class BatchProcessor:
             max_frames: Maximum number of frames to process in total
             processed_field: Field name in Airtable that tracks processing status
             update_airtable: Whether to update the processed status in Airtable
+            max_workers: Maximum number of frames processed concurrently per batch
             
         Returns:
             Dictionary with statistics about the overall processing
@@ -378,7 +382,8 @@ class BatchProcessor:
                 batch_size=batch_size,
                 max_batches=1, # Fetch one batch worth of records from Airtable
                 processed_field=processed_field,
-                update_airtable=update_airtable
+                update_airtable=update_airtable,
+                max_workers=max_workers
             )
             batches_processed += 1
             
@@ -30,6 +30,16 @@ from src.config.settings import (
 # Get a logger for this module
 logger = logging.getLogger("logicLoom.integrations.sequential_processor")
 
+# Downloaded frames allowed to wait for a free processing worker
+DOWNLOAD_QUEUE_SIZE = 8
+
+
+def _decode_image(image_source: Any) -> Image.Image:
+    """Open and fully decode an image so the pixel data is ready to use."""
+    img = Image.open(image_source)
+    img.load()
+    return img
+
 
 class SequentialProcessor:
     """Processes frames from Airtable and Google Drive one at a time, sorted by folder path."""
@@ -72,15 +82,18 @@ class SequentialProcessor:
     async def process_frames(self, max_frames: Optional[int] = None,
                          processed_field: str = None,
                          update_airtable: bool = True,
-                         folder_path_field: str = "FolderPath") -> Dict[str, Any]:
+                         folder_path_field: str = "FolderPath",
+                         max_concurrent: int = 1) -> Dict[str, Any]:
         """
-        Process all unprocessed frames one at a time, sorted by folder path.
+        Process all unprocessed frames, sorted by folder path.
         
         Args:
             max_frames: Maximum number of frames to process in total
             processed_field: Field name in Airtable that tracks processing status
             update_airtable: Whether to update the processed status in Airtable
             folder_path_field: Field name in Airtable that contains the folder path
+            max_concurrent: Maximum number of frames in flight at once (1 processes
+                            them strictly one at a time)
             
         Returns:
             Dictionary with statistics about the overall processing
@@ -115,18 +128,47 @@ class SequentialProcessor:
                 frames = frames[:max_frames]
                 logger.info(f"Limited to processing {max_frames} frames")
             
-            logger.info(f"Processing {len(frames)} frames sequentially, sorted by {folder_path_field}")
+            logger.info(f"Processing {len(frames)} frames sorted by {folder_path_field}, "
+                        f"up to {max_concurrent} at a time")
             
-            # Process frames one at a time
+            # Download frames in order on one producer while up to max_concurrent
+            # consumers process the frames that are already downloaded
             successful = 0
             failed = 0
+            workers = max(1, max_concurrent)
+            queue = asyncio.Queue(maxsize=DOWNLOAD_QUEUE_SIZE)
+            progress = tqdm(total=len(frames), desc="Processing frames")
+            
+            async def produce():
+                for frame in frames:
+                    downloaded = await self._download_frame(frame)
+                    await queue.put((frame, downloaded))
+                for _ in range(workers):
+                    await queue.put(None)
+            
+            async def consume():
+                nonlocal successful, failed
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    frame, downloaded = item
+                    result = False
+                    if downloaded is not None:
+                        metadata, image_source = downloaded
+                        result = await self._process_downloaded_frame(
+                            frame, metadata, image_source, processed_field, update_airtable
+                        )
+                    if result:
+                        successful += 1
+                    else:
+                        failed += 1
+                    progress.update(1)
             
-            for frame in tqdm(frames, desc="Processing frames"):
-                result = await self._process_single_frame(frame, processed_field, update_airtable)
-                if result:
-                    successful += 1
-                else:
-                    failed += 1
+            try:
+                await asyncio.gather(produce(), *(consume() for _ in range(workers)))
+            finally:
+                progress.close()
             
             elapsed_time = time.time() - start_time
             logger.info(f"Sequential processing completed in {elapsed_time:.2f} seconds")
@@ -165,13 +207,33 @@ class SequentialProcessor:
         Returns:
             True if successful, False otherwise
         """
+        downloaded = await self._download_frame(frame)
+        if downloaded is None:
+            return False
+        
+        metadata, image_source = downloaded
+        return await self._process_downloaded_frame(
+            frame, metadata, image_source, processed_field, update_airtable
+        )
+    
+    async def _download_frame(self, frame: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Any]]:
+        """
+        Build the metadata for a frame and download its image from Google Drive.
+        
+        Args:
+            frame: Airtable record for the frame
+            
+        Returns:
+            Tuple of (metadata, image source) where the image source is a file path
+            or an in-memory buffer, or None if the frame could not be downloaded
+        """
         frame_id = frame['id']
         fields = frame['fields']
         
         # Check for required fields
         if DRIVE_FILE_ID_FIELD not in fields:
             logger.error(f"Frame {frame_id} missing required field: {DRIVE_FILE_ID_FIELD}")
-            return False
+            return None
         
         drive_file_id = fields[DRIVE_FILE_ID_FIELD]
         
@@ -193,35 +255,59 @@ class SequentialProcessor:
                                       TIMESTAMP_FIELD, TITLE_FIELD, PROCESSED_FIELD}:
                     metadata[field_name] = field_value
             
-            # Download the image from Google Drive
+            # Download the image from Google Drive off the event loop
             if self.download_to_disk:
                 # Download to disk
-                file_path = self.google_drive_client.download_file(
+                file_path = await asyncio.to_thread(
+                    self.google_drive_client.download_file,
                     file_id=drive_file_id,
                     output_path=os.path.join(self.temp_dir, f"{drive_file_id}.jpg")
                 )
-                
-                # Open the image file
-                with Image.open(file_path) as img:
-                    # Process the frame
-                    success = await self.process_frame_func(img, metadata)
-                
-                # Clean up the file if desired
-                # os.unlink(file_path)
-            else:
-                # Download to memory
-                file_bytes, mime_type = self.google_drive_client.download_file_to_memory(drive_file_id)
-                
-                # Open the image from bytes
-                with Image.open(BytesIO(file_bytes)) as img:
-                    # Process the frame
-                    success = await self.process_frame_func(img, metadata)
+                return metadata, file_path
+            
+            # Download to memory
+            file_bytes, mime_type = await asyncio.to_thread(
+                self.google_drive_client.download_file_to_memory, drive_file_id
+            )
+            return metadata, BytesIO(file_bytes)
+        except Exception as e:
+            logger.error(f"Error downloading frame {frame_id}: {str(e)}")
+            return None
+    
+    async def _process_downloaded_frame(self, frame: Dict[str, Any],
+                                        metadata: Dict[str, Any],
+                                        image_source: Any,
+                                        processed_field: str,
+                                        update_airtable: bool) -> bool:
+        """
+        Process a frame whose image has already been downloaded.
+        
+        Args:
+            frame: Airtable record for the frame
+            metadata: Metadata built for the frame
+            image_source: File path or in-memory buffer holding the image
+            processed_field: Field name in Airtable that indicates if a frame has been processed
+            update_airtable: Whether to update the processed status in Airtable
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        frame_id = frame['id']
+        
+        try:
+            # Decode the image in a worker thread so the event loop keeps
+            # serving downloads and other frames, then process the frame
+            img = await asyncio.to_thread(_decode_image, image_source)
+            with img:
+                success = await self.process_frame_func(img, metadata)
             
             # Update Airtable if successful and requested
             if success and update_airtable:
-                self.airtable_client.mark_record_as_processed(frame_id, processed_field)
+                await asyncio.to_thread(
+                    self.airtable_client.mark_record_as_processed, frame_id, processed_field
+                )
                 
             return success
         except Exception as e:
             logger.error(f"Error processing frame {frame_id}: {str(e)}")
-            return False 
\ No newline at end of file
+            return False 
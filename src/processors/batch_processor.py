@@ -14,7 +14,7 @@ import multiprocessing as mp
 from pathlib import Path
 
 # Import project modules
-from src.processors.frame_processor import process_frame
+from src.processors.frame_processor import FrameProcessor
 from src.api.google_drive import GoogleDriveDownloader
 from src.database.postgres_vector_store import PostgresVectorStore
 
@@ -41,7 +41,9 @@ class BatchProcessor:
         webhook_url: Optional[str] = None,
         test_webhook_url: Optional[str] = None,
         sequential: bool = False,
-        concurrency: int = 4
+        concurrency: int = 4,
+        embedding_cache_path: Optional[str] = None,
+        embed_batch_size: int = 32
     ):
         """
         Initialize the batch processor.
@@ -58,6 +60,8 @@ class BatchProcessor:
             test_webhook_url: Test webhook URL
             sequential: Whether to process files sequentially or in parallel
             concurrency: Maximum number of concurrent processes
+            embedding_cache_path: Optional SQLite file caching embeddings by content hash
+            embed_batch_size: Maximum chunk texts sent per embedding request
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
@@ -70,9 +74,43 @@ class BatchProcessor:
         self.test_webhook_url = test_webhook_url
         self.sequential = sequential
         self.concurrency = min(concurrency, mp.cpu_count())
+        self.embedding_cache_path = embedding_cache_path
+        self.embed_batch_size = embed_batch_size
+        
+        # Frames in flight at once when processing in parallel
+        self._semaphore = asyncio.Semaphore(1 if sequential else self.concurrency)
         
         logger.info(f"Initialized BatchProcessor (sequential={sequential}, concurrency={self.concurrency})")
     
+    def _create_frame_processor(self) -> FrameProcessor:
+        """Create the frame processor used for every file in a run."""
+        return FrameProcessor(
+            use_postgres=self.save_to_postgres,
+            use_webhook=bool(self.webhook_url or self.test_webhook_url),
+            embedding_cache_path=self.embedding_cache_path,
+            embed_batch_size=self.embed_batch_size
+        )
+    
+    async def _process_file(self, frame_processor: FrameProcessor, file_path: str) -> bool:
+        """
+        Process one file with the shared frame processor.
+        
+        Args:
+            frame_processor: Frame processor created for this run
+            file_path: Path of the frame to process
+        
+        Returns:
+            True if the frame was processed successfully
+        """
+        async with self._semaphore:
+            result = await frame_processor.process_frame(
+                frame_path=file_path,
+                chunk_size=self.chunk_size,
+                chunk_overlap=self.chunk_overlap,
+                max_chunks=self.max_chunks
+            )
+        return result.get("success", False)
+    
     async def process_files(
         self, 
         files: List[str],
@@ -110,76 +148,16 @@ class BatchProcessor:
                 logger.error("Failed to download files from Google Drive")
                 return results
         
-        if self.sequential:
-            # Process files sequentially
-            logger.info(f"Processing {len(files)} files sequentially")
-            for file_path in files:
-                try:
-                    success = await process_frame(
-                        frame_path=file_path,
-                        chunk_size=self.chunk_size,
-                        chunk_overlap=self.chunk_overlap,
-                        max_chunks=self.max_chunks,
-                        use_key_rotation=self.use_key_rotation,
-                        save_to_airtable=self.save_to_airtable,
-                        save_to_postgres=self.save_to_postgres,
-                        postgres_connection_string=self.postgres_connection_string,
-                        webhook_url=self.webhook_url,
-                        test_webhook_url=self.test_webhook_url
-                    )
-                    
-                    results['processed'] += 1
-                    if success:
-                        results['successful'] += 1
-                    else:
-                        results['failed'] += 1
-                    
-                    logger.info(f"Progress: {results['processed']}/{results['total']} files processed")
-                    
-                    # Add file result
-                    results['files'].append({
-                        'path': file_path,
-                        'success': success
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {file_path}: {e}")
-                    results['processed'] += 1
-                    results['failed'] += 1
-                    results['files'].append({
-                        'path': file_path,
-                        'success': False,
-                        'error': str(e)
-                    })
-        else:
-            # Process files in parallel
-            logger.info(f"Processing {len(files)} files in parallel (concurrency={self.concurrency})")
-            tasks = []
-            
-            for file_path in files:
-                task = asyncio.create_task(process_frame(
-                    frame_path=file_path,
-                    chunk_size=self.chunk_size,
-                    chunk_overlap=self.chunk_overlap,
-                    max_chunks=self.max_chunks,
-                    use_key_rotation=self.use_key_rotation,
-                    save_to_airtable=self.save_to_airtable,
-                    save_to_postgres=self.save_to_postgres,
-                    postgres_connection_string=self.postgres_connection_string,
-                    webhook_url=self.webhook_url,
-                    test_webhook_url=self.test_webhook_url
-                ))
-                tasks.append((file_path, task))
-            
-            # Process tasks with rate limiting
-            chunk_size = self.concurrency
-            for i in range(0, len(tasks), chunk_size):
-                chunk = tasks[i:i+chunk_size]
-                
-                # Wait for the current chunk to complete
-                for file_path, task in chunk:
+        # One frame processor is shared by every file so its embedder can
+        # cache and batch embedding requests across frames
+        frame_processor = self._create_frame_processor()
+        try:
+            if self.sequential:
+                # Process files sequentially
+                logger.info(f"Processing {len(files)} files sequentially")
+                for file_path in files:
                     try:
-                        success = await task
+                        success = await self._process_file(frame_processor, file_path)
                         
                         results['processed'] += 1
                         if success:
@@ -187,6 +165,9 @@ class BatchProcessor:
                         else:
                             results['failed'] += 1
                         
+                        logger.info(f"Progress: {results['processed']}/{results['total']} files processed")
+                        
+                        # Add file result
                         results['files'].append({
                             'path': file_path,
                             'success': success
@@ -201,8 +182,50 @@ class BatchProcessor:
                             'success': False,
                             'error': str(e)
                         })
+            else:
+                # Process files in parallel
+                logger.info(f"Processing {len(files)} files in parallel (concurrency={self.concurrency})")
+                tasks = []
                 
-                logger.info(f"Progress: {results['processed']}/{results['total']} files processed")
+                for file_path in files:
+                    task = asyncio.create_task(self._process_file(frame_processor, file_path))
+                    tasks.append((file_path, task))
+                
+                # Process tasks with rate limiting
+                chunk_size = self.concurrency
+                for i in range(0, len(tasks), chunk_size):
+                    chunk = tasks[i:i+chunk_size]
+                    
+                    # Wait for the current chunk to complete
+                    for file_path, task in chunk:
+                        try:
+                            success = await task
+                            
+                            results['processed'] += 1
+                            if success:
+                                results['successful'] += 1
+                            else:
+                                results['failed'] += 1
+                            
+                            results['files'].append({
+                                'path': file_path,
+                                'success': success
+                            })
+                            
+                        except Exception as e:
+                            logger.error(f"Error processing {file_path}: {e}")
+                            results['processed'] += 1
+                            results['failed'] += 1
+                            results['files'].append({
+                                'path': file_path,
+                                'success': False,
+                                'error': str(e)
+                            })
+                    
+                    logger.info(f"Progress: {results['processed']}/{results['total']} files processed")
+            
+        finally:
+            await frame_processor.close()
         
         logger.info(f"Batch processing complete: {results['successful']} successful, {results['failed']} failed out of {results['total']} files")
         return results
@@ -219,7 +242,9 @@ async def process_directory(
     save_to_airtable: bool = True,
     save_to_postgres: bool = True,
     use_webhook: bool = False,
-    use_test_webhook: bool = True
+    use_test_webhook: bool = True,
+    embedding_cache_path: Optional[str] = None,
+    embed_batch_size: int = 32
 ) -> Dict[str, Any]:
     """
     Process all matching files in a directory.
@@ -237,6 +262,8 @@ async def process_directory(
         save_to_postgres: Whether to save results to PostgreSQL
         use_webhook: Whether to send results to webhook
         use_test_webhook: Whether to use test webhook URL
+        embedding_cache_path: Optional SQLite file caching embeddings by content hash
+        embed_batch_size: Maximum chunk texts sent per embedding request
     
     Returns:
         Dictionary with processing results
@@ -276,7 +303,9 @@ async def process_directory(
         webhook_url=os.environ.get('WEBHOOK_URL') if use_webhook else None,
         test_webhook_url=os.environ.get('WEBHOOK_TEST_URL') if use_webhook and use_test_webhook else None,
         sequential=sequential,
-        concurrency=concurrency
+        concurrency=concurrency,
+        embedding_cache_path=embedding_cache_path,
+        embed_batch_size=embed_batch_size
     )
     
     # Process files
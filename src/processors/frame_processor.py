@@ -23,6 +23,7 @@ from src.utils.chunking import create_structured_chunks
 
 # Import embeddings
 from src.embeddings.chunk_embedder import ChunkEmbedder
+from src.embeddings.embedding_cache import EmbeddingCache
 
 # Import database
 from src.database.postgres_vector_store import PostgresVectorStore
@@ -38,6 +39,9 @@ logger = logging.getLogger("processor")
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Chunk texts grouped into one embedding request by default
+DEFAULT_EMBED_BATCH_SIZE = 32
+
 class FrameProcessor:
     """
     Processor for handling frame processing, metadata extraction, and embedding generation.
@@ -54,7 +58,9 @@ class FrameProcessor:
                 embedding_model: str = "voyage-large-2",
                 use_postgres: bool = True,
                 use_webhook: bool = False,
-                tesseract_config: Optional[Dict[str, Any]] = None):
+                tesseract_config: Optional[Dict[str, Any]] = None,
+                embedding_cache_path: Optional[str] = None,
+                embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE):
         """
         Initialize the frame processor.
         
@@ -64,14 +70,18 @@ class FrameProcessor:
             use_postgres: Whether to store results in PostgreSQL
             use_webhook: Whether to send results via webhook
             tesseract_config: Optional configuration for Tesseract OCR
+            embedding_cache_path: Optional SQLite file caching embeddings by content hash
+            embed_batch_size: Maximum chunk texts sent per embedding request (default: 32)
         """
         # Initialize API keys
         self.voyage_api_key = voyage_api_key or os.getenv("VOYAGE_API_KEY")
         if not self.voyage_api_key:
             raise ValueError("Voyage API key is required")
         
-        # Initialize embedder
-        self.embedder = ChunkEmbedder(api_key=self.voyage_api_key, model=embedding_model)
+        # Initialize embedder, with a persistent cache if requested
+        self.embedding_cache = EmbeddingCache(embedding_cache_path) if embedding_cache_path else None
+        self.embedder = ChunkEmbedder(api_key=self.voyage_api_key, model=embedding_model,
+                                      cache=self.embedding_cache, embed_batch_size=embed_batch_size)
         
         # Configuration
         self.use_postgres = use_postgres
@@ -182,21 +192,20 @@ class FrameProcessor:
             result["total_chunks"] = len(chunks)
             logger.info(f"Generated {len(chunks)} chunks from metadata")
             
-            # Generate embeddings for each chunk
+            # Skip empty chunks
+            chunks = [chunk for chunk in chunks if chunk["text"].strip()]
+            
+            # Generate embeddings for all chunks at once so the embedder can
+            # send them in batched requests
+            chunk_embeddings = await asyncio.gather(
+                *(self.embedder.embed_text(chunk["text"]) for chunk in chunks)
+            )
+            
+            # Store chunks with embeddings
             embeddings = []
-            for chunk in chunks:
-                chunk_text = chunk["text"]
-                
-                # Skip empty chunks
-                if not chunk_text.strip():
-                    continue
-                
-                # Generate embedding
-                embedding = await self.embedder.embed_text(chunk_text)
-                
-                # Store chunk with embedding
+            for chunk, embedding in zip(chunks, chunk_embeddings):
                 embeddings.append({
-                    "text": chunk_text,
+                    "text": chunk["text"],
                     "embedding": embedding,
                     "sequence_id": chunk["sequence_id"],
                     "metadata": chunk["metadata"]
@@ -363,10 +372,13 @@ class FrameProcessor:
             logger.error(f"Failed to send webhook: {e}")
             return False
     
-    def close(self):
+    async def close(self):
         """Close any open connections."""
         if self.pg_store:
-            self.pg_store.close()
+            await self.pg_store.close()
+        await self.embedder.close()
+        if self.embedding_cache:
+            self.embedding_cache.close()
 
     async def extract_text(self, image: Image.Image) -> str:
         """
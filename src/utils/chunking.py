@@ -9,7 +9,11 @@ import numpy as np
 import os
 import json
 from dotenv import load_dotenv
-from langchain.text_splitter import RecursiveCharacterTextSplitter, TokenTextSplitter
+try:
+    from langchain_text_splitters import RecursiveCharacterTextSplitter, TokenTextSplitter
+except ImportError:
+    # Older langchain releases bundle the splitters
+    from langchain.text_splitter import RecursiveCharacterTextSplitter, TokenTextSplitter
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -0,0 +1,63 @@
+"""
+Unit tests for the Airtable metadata lookup of process_frame_with_metadata.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import process_frame_with_metadata as metadata
+
+
+class FakeTable:
+    """Airtable table stand-in that counts full-table fetches."""
+
+    def __init__(self, records=None, error=None):
+        self.records = records or []
+        self.error = error
+        self.fetches = 0
+
+    def all(self, **kwargs):
+        self.fetches += 1
+        if self.error:
+            raise self.error
+        return self.records
+
+
+def make_finder(table):
+    finder = metadata.AirtableMetadataFinder("token", "base", "table")
+    finder.table = table
+    return finder
+
+
+def record(record_id, frame_number, folder):
+    return {"id": record_id, "fields": {
+        metadata.FRAME_NUMBER_FIELD: frame_number,
+        metadata.FOLDER_NAME_FIELD: folder,
+    }}
+
+
+def test_bulk_lookup_matches_frames_with_one_fetch():
+    table = FakeTable([
+        record("rec1", 1, "video_a"),
+        record("rec2", 1, "video_b"),
+        record("rec3", 2, "video_b"),
+    ])
+    finder = make_finder(table)
+
+    results = finder.find_records_bulk([
+        "/frames/video_b/frame_000001.jpg",
+        "/frames/video_b/frame_000002.jpg",
+        "/frames/video_c/frame_000009.jpg",
+    ])
+
+    assert [r and r["id"] for r in results.values()] == ["rec2", "rec3", None]
+    assert table.fetches == 1
+
+
+def test_bulk_lookup_returns_none_when_airtable_fails():
+    finder = make_finder(FakeTable(error=RuntimeError("rate limited")))
+    paths = ["/frames/video_a/frame_000001.jpg", "/frames/video_a/frame_000002.jpg"]
+
+    assert finder.find_records_bulk(paths) == {path: None for path in paths}
@@ -0,0 +1,97 @@
+"""
+Tests that the embedding cache and batch size options reach the frame processor.
+"""
+
+import asyncio
+
+import pytest
+
+from src.processors import batch_processor
+from src.processors.frame_processor import FrameProcessor
+
+
+class RecordingStore:
+    """Stand-in for PostgresVectorStore that records whether its pool was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class RecordingFrameProcessor:
+    """Stand-in for FrameProcessor that records how it was built and used."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.frames = []
+        self.closed = False
+        RecordingFrameProcessor.instances.append(self)
+
+    async def process_frame(self, frame_path, **kwargs):
+        self.frames.append(frame_path)
+        return {"frame_path": frame_path, "success": True}
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def frames_dir(tmp_path):
+    for i in range(3):
+        (tmp_path / f"frame_{i:06d}.jpg").write_bytes(b"jpeg")
+    return tmp_path
+
+
+@pytest.mark.parametrize("sequential", [True, False])
+def test_process_directory_builds_one_frame_processor_with_embedding_options(monkeypatch, frames_dir, tmp_path, sequential):
+    RecordingFrameProcessor.instances = []
+    monkeypatch.setattr(batch_processor, "FrameProcessor", RecordingFrameProcessor)
+    cache_path = str(tmp_path / "embeddings.sqlite3")
+
+    results = asyncio.run(batch_processor.process_directory(
+        input_path=str(frames_dir),
+        sequential=sequential,
+        save_to_airtable=False,
+        save_to_postgres=False,
+        embedding_cache_path=cache_path,
+        embed_batch_size=8
+    ))
+
+    assert results["successful"] == 3
+    assert len(RecordingFrameProcessor.instances) == 1
+    frame_processor = RecordingFrameProcessor.instances[0]
+    assert frame_processor.kwargs["embedding_cache_path"] == cache_path
+    assert frame_processor.kwargs["embed_batch_size"] == 8
+    assert sorted(frame_processor.frames) == sorted(str(p) for p in frames_dir.glob("*.jpg"))
+    assert frame_processor.closed
+
+
+def test_frame_processor_passes_cache_and_batch_size_to_embedder(tmp_path):
+    frame_processor = FrameProcessor(
+        voyage_api_key="test-key",
+        use_postgres=False,
+        embedding_cache_path=str(tmp_path / "embeddings.sqlite3"),
+        embed_batch_size=8
+    )
+    try:
+        assert frame_processor.embedder.cache is frame_processor.embedding_cache
+        assert frame_processor.embedder.embed_batch_size == 8
+    finally:
+        asyncio.run(frame_processor.close())
+
+
+def test_frame_processor_close_awaits_the_postgres_pool(tmp_path):
+    frame_processor = FrameProcessor(
+        voyage_api_key="test-key",
+        use_postgres=False,
+        embedding_cache_path=str(tmp_path / "embeddings.sqlite3")
+    )
+    frame_processor.pg_store = RecordingStore()
+
+    asyncio.run(frame_processor.close())
+
+    assert frame_processor.pg_store.closed
@@ -0,0 +1,183 @@
+"""
+Unit tests for ChunkEmbedder request batching and concurrency limits.
+"""
+
+import asyncio
+
+from src.embeddings import chunk_embedder
+from src.embeddings.chunk_embedder import ChunkEmbedder
+
+
+class FakeResponse:
+    """Embedding API response carrying one vector per input text."""
+
+    def __init__(self, texts, status=200):
+        self.status = status
+        self._texts = texts
+
+    async def json(self):
+        # Return the items out of order to check they are sorted by index
+        return {"data": [
+            {"index": i, "embedding": [float(len(text))]}
+            for i, text in reversed(list(enumerate(self._texts)))
+        ]}
+
+    async def text(self):
+        return "error"
+
+
+class FakeSession:
+    """aiohttp session stand-in recording the payloads and peak concurrency."""
+
+    def __init__(self, status=200):
+        self.closed = False
+        self.status = status
+        self.payloads = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def post(self, url, json):
+        session = self
+        texts = json["input"] if isinstance(json["input"], list) else [json["input"]]
+
+        class Request:
+            async def __aenter__(self):
+                session.payloads.append(texts)
+                session.in_flight += 1
+                session.peak_in_flight = max(session.peak_in_flight, session.in_flight)
+                await asyncio.sleep(0.01)
+                return FakeResponse(texts, session.status)
+
+            async def __aexit__(self, *exc_info):
+                session.in_flight -= 1
+
+        return Request()
+
+    async def close(self):
+        self.closed = True
+
+
+def make_embedder(session, **kwargs):
+    embedder = ChunkEmbedder(api_key="test-key", **kwargs)
+    embedder.session = session
+    return embedder
+
+
+def test_unbatched_requests_are_bounded():
+    session = FakeSession()
+    embedder = make_embedder(session)
+
+    async def run():
+        return await asyncio.gather(*(embedder.embed_text("x" * i) for i in range(1, 21)))
+
+    results = asyncio.run(run())
+
+    assert results == [[float(i)] for i in range(1, 21)]
+    assert len(session.payloads) == 20
+    assert session.peak_in_flight <= chunk_embedder.MAX_CONCURRENT_EMBED_REQUESTS
+
+
+def test_batched_request_uses_caller_retry_count(monkeypatch):
+    session = FakeSession(status=500)
+    embedder = make_embedder(session, embed_batch_size=4, max_wait_ms=1)
+
+    async def no_sleep(delay):
+        pass
+
+    async def run():
+        monkeypatch.setattr(chunk_embedder.asyncio, "sleep", no_sleep)
+        return await asyncio.gather(
+            embedder.embed_text("a", retry_count=1),
+            embedder.embed_text("b", retry_count=2)
+        )
+
+    results = asyncio.run(run())
+
+    assert results == [[], []]
+    assert session.payloads == [["a", "b"], ["a", "b"]]
+
+
+def test_batch_tasks_are_referenced_until_done():
+    session = FakeSession()
+    embedder = make_embedder(session, embed_batch_size=2)
+
+    async def run():
+        pending = [asyncio.ensure_future(embedder.embed_text(text)) for text in ("a", "bb")]
+        await asyncio.sleep(0)
+        assert len(embedder._batch_tasks) == 1
+        results = await asyncio.gather(*pending)
+        await asyncio.sleep(0)
+        return results
+
+    assert asyncio.run(run()) == [[1.0], [2.0]]
+    assert not embedder._batch_tasks
+
+
+def test_full_batch_is_sent_without_waiting():
+    session = FakeSession()
+    embedder = make_embedder(session, embed_batch_size=3, max_wait_ms=60000)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(*(embedder.embed_text(text) for text in ("a", "bb", "ccc"))),
+            timeout=5
+        )
+
+    assert asyncio.run(run()) == [[1.0], [2.0], [3.0]]
+    assert session.payloads == [["a", "bb", "ccc"]]
+    assert embedder._flush_handle is None
+
+
+def test_partial_batch_is_sent_after_max_wait():
+    session = FakeSession()
+    embedder = make_embedder(session, embed_batch_size=10, max_wait_ms=5)
+
+    async def run():
+        pending = [asyncio.ensure_future(embedder.embed_text(text)) for text in ("a", "bb")]
+        await asyncio.sleep(0)
+        assert session.payloads == []
+        return await asyncio.gather(*pending)
+
+    assert asyncio.run(run()) == [[1.0], [2.0]]
+    assert session.payloads == [["a", "bb"]]
+
+
+def test_repeated_texts_are_embedded_once_and_shared():
+    session = FakeSession()
+    embedder = make_embedder(session, embed_batch_size=4)
+
+    async def run():
+        return await asyncio.gather(*(embedder.embed_text(text) for text in ("a", "bb", "a", "bb")))
+
+    assert asyncio.run(run()) == [[1.0], [2.0], [1.0], [2.0]]
+    assert session.payloads == [["a", "bb"]]
+
+
+def test_results_follow_caller_order_not_response_order():
+    session = FakeSession()
+    embedder = make_embedder(session, embed_batch_size=5)
+    texts = ["eeeee", "a", "ccc", "bb", "dddd"]
+
+    async def run():
+        return await asyncio.gather(*(embedder.embed_text(text) for text in texts))
+
+    assert asyncio.run(run()) == [[float(len(text))] for text in texts]
+
+
+def test_failed_batch_resolves_every_waiting_caller(monkeypatch):
+    session = FakeSession()
+    embedder = make_embedder(session, embed_batch_size=3)
+
+    async def fail(texts, retry_count=3):
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(embedder, "_request_embeddings", fail)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(*(embedder.embed_text(text) for text in ("a", "bb", "a"))),
+            timeout=5
+        )
+
+    assert asyncio.run(run()) == [[], [], []]
+    assert not embedder._batch_tasks
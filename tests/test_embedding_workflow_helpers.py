@@ -0,0 +1,78 @@
+"""
+Unit tests for the numeric helpers of the embedding workflow and the bulk
+reference_id update.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from scripts.process_embedding_workflow import quantize_embedding_sq8, wilson_interval
+from update_reference_ids import set_reference_ids
+
+
+class RecordingConnection:
+    """asyncpg connection stand-in that records executed statements."""
+
+    def __init__(self, status="UPDATE 2"):
+        self.status = status
+        self.calls = []
+
+    async def execute(self, query, *args):
+        self.calls.append((query, args))
+        return self.status
+
+
+def test_quantize_embedding_sq8_round_trips_within_one_step():
+    embedding = np.array([0.5, -1.0, 0.25, 0.0, 0.999], dtype=np.float32)
+    quantized, scale = quantize_embedding_sq8(embedding)
+
+    assert quantized.dtype == np.int8
+    assert quantized.tolist()[:2] == [64, -127]
+    assert scale == pytest.approx(1.0 / 127)
+    assert np.max(np.abs(quantized * scale - embedding)) <= scale / 2 + 1e-7
+
+
+@pytest.mark.parametrize("embedding", [np.zeros(4, dtype=np.float32), np.array([], dtype=np.float32)])
+def test_quantize_embedding_sq8_handles_zero_and_empty_vectors(embedding):
+    quantized, scale = quantize_embedding_sq8(embedding)
+    assert quantized.shape == embedding.shape
+    assert not quantized.any()
+    assert scale == 1.0
+
+
+def test_wilson_interval_without_trials_is_uninformative():
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+@pytest.mark.parametrize("successes, total, expected", [
+    (50, 100, (0.4038, 0.5962)),
+    (0, 10, (0.0, 0.2775)),
+    (10, 10, (0.7225, 1.0)),
+])
+def test_wilson_interval_matches_reference_values(successes, total, expected):
+    lower, upper = wilson_interval(successes, total)
+    assert lower == pytest.approx(expected[0], abs=1e-4)
+    assert upper == pytest.approx(expected[1], abs=1e-4)
+    assert 0.0 <= lower <= successes / total <= upper <= 1.0
+
+
+def test_set_reference_ids_sends_one_update_for_all_rows():
+    conn = RecordingConnection()
+    updates = [("folder/frame_1.jpg", 1), ("folder/frame_2.jpg", 2)]
+
+    updated = asyncio.run(set_reference_ids(conn, "content.frames", "frame_id", updates))
+
+    assert updated == 2
+    assert len(conn.calls) == 1
+    query, args = conn.calls[0]
+    assert "UPDATE content.frames t" in query
+    assert "WHERE t.frame_id = data.key" in query
+    assert "IS DISTINCT FROM" in query
+    assert args == (["folder/frame_1.jpg", "folder/frame_2.jpg"], ["1", "2"])
+
+
+def test_set_reference_ids_returns_rows_actually_changed():
+    conn = RecordingConnection(status="UPDATE 0")
+    assert asyncio.run(set_reference_ids(conn, "content.frames", "frame_id", [("a/b.jpg", 1)])) == 0
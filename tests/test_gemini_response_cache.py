@@ -0,0 +1,55 @@
+"""
+Unit tests for the SQLite Gemini response cache of the frame pipeline.
+"""
+
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import process_frame_pipeline as pipeline
+
+
+def read_last_used(db_path, text_hash):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT last_used_at FROM gemini_cache WHERE text_hash = ?", (text_hash,)
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_hits_update_last_used_at_on_close(monkeypatch, tmp_path):
+    db_path = str(tmp_path / "gemini_cache.sqlite3")
+    cache = pipeline.GeminiResponseCache(db_path, namespace="test")
+    clock = iter([100.0, 200.0, 300.0])
+    monkeypatch.setattr(pipeline.time, "time", lambda: next(clock))
+
+    cache.put("hash", None, {"summary": "cached"})
+    assert cache.get_exact("hash") == {"summary": "cached"}
+    assert cache.get_exact("hash") == {"summary": "cached"}
+
+    # Hits are not written one by one
+    assert read_last_used(db_path, "hash") == 100.0
+
+    cache.close()
+    assert read_last_used(db_path, "hash") == 300.0
+    cache.close()
+
+
+def test_pending_hits_are_written_in_batches(monkeypatch, tmp_path):
+    monkeypatch.setattr(pipeline, "GEMINI_CACHE_PRUNE_INTERVAL", 2)
+    db_path = str(tmp_path / "gemini_cache.sqlite3")
+    cache = pipeline.GeminiResponseCache(db_path, namespace="test")
+    cache.put("a", None, {"summary": "a"})
+    cache.put("b", None, {"summary": "b"})
+    put_at = read_last_used(db_path, "a")
+
+    cache.get_exact("a")
+    assert read_last_used(db_path, "a") == put_at
+    cache.get_exact("b")
+    assert read_last_used(db_path, "a") > put_at
+    assert read_last_used(db_path, "b") > put_at
+    cache.close()
@@ -0,0 +1,146 @@
+"""
+Unit tests for Gemini key switching in the frame pipeline.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import process_frame_pipeline as pipeline
+
+
+class FakeCachedContent:
+    """Context cache stand-in that records its creation arguments and deletion."""
+
+    created = []
+
+    def __init__(self, **kwargs):
+        self.name = f"cachedContents/{len(FakeCachedContent.created)}"
+        self.model = f"models/{kwargs['model']}"
+        self.kwargs = kwargs
+        self.deleted = False
+        FakeCachedContent.created.append(self)
+
+    def delete(self):
+        self.deleted = True
+
+
+class FakeServiceClient:
+    """Gemini service client stand-in that records its API key."""
+
+    def __init__(self, client_options):
+        self.api_key = client_options["api_key"]
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    """FrameProcessor with only the Gemini key state set up."""
+    acquired = []
+    monkeypatch.setattr(pipeline, "acquire_gemini_key", lambda preferred=None: acquired.pop(0))
+    monkeypatch.setattr(pipeline, "get_next_gemini_key", lambda: "key-next")
+    monkeypatch.setattr(pipeline.glm, "GenerativeServiceClient", FakeServiceClient)
+    monkeypatch.setattr(pipeline.glm, "GenerativeServiceAsyncClient", FakeServiceClient)
+
+    frame_processor = pipeline.FrameProcessor.__new__(pipeline.FrameProcessor)
+    frame_processor._gemini_key_lock = threading.RLock()
+    frame_processor._gemini_models = {}
+    frame_processor._gemini_context_caches = {}
+    frame_processor._gemini_generation_config = None
+    frame_processor.acquired = acquired
+    frame_processor.rotate_gemini_key("key-a")
+    return frame_processor
+
+
+def test_models_are_bound_to_their_own_key(processor):
+    model_a = processor.get_gemini_model("key-a")
+    model_b = processor.get_gemini_model("key-b")
+
+    assert model_a._client.api_key == "key-a"
+    assert model_b._client.api_key == "key-b"
+    assert processor.get_gemini_model("key-a") is model_a
+
+    # Async clients are created on the event loop of the first async request
+    assert model_a._async_client is None
+    processor.bind_gemini_async_client(model_a, "key-a")
+    assert model_a._async_client.api_key == "key-a"
+
+
+def test_pinned_client_keeps_the_service_clients_that_are_bound():
+    # Binding replaces private attributes, so it is limited to known releases
+    assert pipeline.GEMINI_CLIENT_BINDING
+    model = pipeline.genai.GenerativeModel(pipeline.DEFAULT_MODEL)
+    assert model._client is None
+    assert model._async_client is None
+
+
+def test_models_fall_back_to_the_process_wide_key(monkeypatch, processor):
+    configured = []
+    monkeypatch.setattr(pipeline, "GEMINI_CLIENT_BINDING", False)
+    monkeypatch.setattr(pipeline.genai, "configure", lambda api_key: configured.append(api_key))
+
+    model = processor.get_gemini_model("key-b")
+    processor.bind_gemini_async_client(model, "key-b")
+
+    assert configured == ["key-b"]
+    assert model._client is None
+    assert model._async_client is None
+
+
+def test_key_switch_works_off_the_main_thread(processor):
+    processor.acquired.append("key-b")
+    results = []
+    thread = threading.Thread(target=lambda: results.append(processor.acquire_gemini_request_key()))
+    thread.start()
+    thread.join()
+
+    api_key, model, _ = results[0]
+    assert api_key == "key-b"
+    assert model._client.api_key == "key-b"
+
+
+def test_acquired_key_matches_the_returned_model(processor):
+    processor.acquired.extend(["key-b", "key-a"])
+
+    api_key, model, cached_model = processor.acquire_gemini_request_key()
+    assert api_key == "key-b"
+    assert model is processor.get_gemini_model("key-b")
+    assert cached_model is None
+
+    api_key, model, _ = processor.acquire_gemini_request_key()
+    assert api_key == "key-a"
+    assert model is processor.get_gemini_model("key-a")
+
+
+def test_context_caches_are_kept_per_key_and_not_deleted(monkeypatch, processor):
+    FakeCachedContent.created = []
+    monkeypatch.setattr(pipeline, "GEMINI_CONTEXT_CACHE_TTL_SECONDS", "3600")
+    monkeypatch.setattr(pipeline.genai.caching.CachedContent, "create", FakeCachedContent)
+
+    processor.rotate_gemini_key("key-b")
+    processor.rotate_gemini_key("key-c")
+    processor.rotate_gemini_key("key-b")
+
+    assert set(processor._gemini_context_caches) == {"key-b", "key-c"}
+    assert len(FakeCachedContent.created) == 2
+    assert not any(cache.deleted for cache in FakeCachedContent.created)
+    assert processor.get_gemini_cached_model("key-b") is processor._gemini_context_caches["key-b"][1]
+
+
+def test_context_cache_builds_a_model_on_the_cache(monkeypatch, processor):
+    FakeCachedContent.created = []
+    monkeypatch.setattr(pipeline, "GEMINI_CONTEXT_CACHE_TTL_SECONDS", "3600")
+    monkeypatch.setattr(pipeline.genai.caching.CachedContent, "create", FakeCachedContent)
+
+    processor.rotate_gemini_key("key-b")
+
+    cache = FakeCachedContent.created[0]
+    assert cache.kwargs["system_instruction"] == pipeline.GEMINI_PROMPT_PREFIX
+    assert cache.kwargs["ttl"].total_seconds() == 3600
+
+    cached_model = processor.get_gemini_cached_model("key-b")
+    assert cached_model.cached_content == cache.name
+    assert cached_model.model_name == cache.model
@@ -0,0 +1,174 @@
+"""
+Unit tests for the pure helpers of the frame pipeline.
+"""
+
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import process_frame_pipeline as pipeline
+from scripts.ocr_data_processor import build_ocr_chunk_rows
+
+
+class StreamChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+def stream(text, size):
+    """Yield text as streamed response chunks of the given size."""
+    for i in range(0, len(text), size):
+        yield StreamChunk(text[i:i + size])
+
+
+class GeminiError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+@pytest.mark.parametrize("text, degenerate", [
+    ("", True),
+    ("   short   ", True),
+    ("=" * 100, True),
+    ("ab" * 50, True),
+    ("def main():\n    return process_frames(frame_ids)", False),
+])
+def test_is_degenerate_ocr_text(text, degenerate):
+    assert pipeline.is_degenerate_ocr_text(text) is degenerate
+
+
+def test_extract_json_content_unwraps_code_block():
+    response = 'Here you go:\n```json\n{"summary": "a", "topics": []}\n```\nDone.'
+    assert json.loads(pipeline.extract_json_content(response)) == {"summary": "a", "topics": []}
+
+
+def test_extract_json_content_returns_bare_json_unchanged():
+    response = '{"summary": "a"}'
+    assert pipeline.extract_json_content(response) == response
+
+
+def test_gemini_json_generation_config_requests_json():
+    config = pipeline.gemini_json_generation_config()
+    assert config.response_mime_type == "application/json"
+
+    # The pinned client accepts the config when building a model
+    pipeline.genai.GenerativeModel(pipeline.DEFAULT_MODEL, generation_config=config)
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_read_gemini_stream_stops_after_closing_fence(size):
+    body = json.dumps({"summary": "code: ```python\nprint(1)\n``` end", "topics": ["x"]})
+    response = f"```json\n{body}\n```"
+    text = pipeline.read_gemini_stream(stream(response + "\nTrailing text that is never needed" * 20, size))
+
+    assert text.startswith(response)
+    assert len(text) < len(response) + size
+    assert json.loads(pipeline.extract_json_content(text)) == json.loads(body)
+
+
+def test_read_gemini_stream_reads_everything_without_code_block():
+    response = '{"summary": "bare json"}'
+    assert pipeline.read_gemini_stream(stream(response, 4)) == response
+
+
+def test_build_ocr_chunk_rows_uses_paragraphs():
+    structured = {"paragraphs": ["first", "second"], "contains_sensitive_info": True}
+    rows = build_ocr_chunk_rows("frame_1", structured)
+
+    assert [row[:3] for row in rows] == [["frame_1", 0, "first"], ["frame_1", 1, "second"]]
+    assert [row[5] for row in rows] == [5, 6]
+    assert all(row[6:] == ["ocr_only", json.dumps(structured), "true", "1"] for row in rows)
+
+
+def test_build_ocr_chunk_rows_splits_raw_text():
+    rows = build_ocr_chunk_rows("frame_1", {"raw_text": "one\n\ntwo\n\n  \n\nthree"})
+    assert [row[2] for row in rows] == ["one", "two", "three"]
+    assert rows[0][9] == "0"
+
+
+def test_build_ocr_chunk_rows_without_text():
+    assert build_ocr_chunk_rows("frame_1", {"summary": "nothing"}) == []
+
+
+def test_gemini_batcher_halves_limit_on_overload_and_grows_after_successes(monkeypatch):
+    monkeypatch.setattr(pipeline, "GEMINI_SUCCESS_STREAK_TO_GROW", 2)
+    batcher = pipeline.GeminiBatcher(None, batch_size=1, max_in_flight=8)
+
+    def release(error=None):
+        batcher._active += 1
+        batcher._release_slot(error)
+
+    release(GeminiError(429))
+    assert batcher._limit == 4
+    release(GeminiError(503))
+    assert batcher._limit == 2
+    release(GeminiError(400))
+    assert batcher._limit == 2
+    release(ValueError("no code"))
+    assert batcher._limit == 2
+
+    release()
+    assert batcher._limit == 2
+    release()
+    assert batcher._limit == 3
+
+    for _ in range(20):
+        release()
+    assert batcher._limit == 8
+    assert batcher._active == 0
+
+
+def test_gemini_batcher_limit_never_drops_below_one():
+    batcher = pipeline.GeminiBatcher(None, batch_size=1, max_in_flight=2)
+    for _ in range(3):
+        batcher._active += 1
+        batcher._release_slot(GeminiError(429))
+    assert batcher._limit == 1
+
+
+def test_gemini_batcher_shares_requests_for_identical_text():
+    sent = []
+    released = threading.Event()
+
+    async def send_batch(items):
+        sent.append(items)
+        released.wait(5)
+        return {frame_id: f"result for {frame_id}" for frame_id, _ in items}
+
+    batcher = pipeline.GeminiBatcher(send_batch, batch_size=4, max_wait=0.05)
+    first = batcher.submit("frame_1", "same text")
+    second = batcher.submit("frame_2", "same text")
+    released.set()
+
+    assert second is first
+    assert first.result(timeout=5) == "result for frame_1"
+    assert sent == [[("frame_1", "same text")]]
+
+
+def test_master_logger_writes_one_shard_per_thread(tmp_path):
+    master_logger = pipeline.MasterLogger(str(tmp_path), run_timestamp="run")
+
+    def log_frames(name):
+        for i in range(50):
+            master_logger.log_ocr_processing(f"{name}_{i}", "raw_ocr", {"i": i})
+        master_logger.flush()
+
+    threads = [threading.Thread(target=log_frames, args=(name,)) for name in ("a", "b", "c")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    master_logger.close()
+
+    shards = sorted(master_logger.master_log_dir.glob("master_log_run_*.jsonl"))
+    assert len(shards) == 3
+    for shard in shards:
+        entries = [json.loads(line) for line in shard.read_text().splitlines()]
+        assert len({entry["frame_id"].split("_")[0] for entry in entries}) == 1
+        assert [entry["data"]["i"] for entry in entries] == list(range(50))
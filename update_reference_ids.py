@@ -16,6 +16,13 @@ import re
 from dotenv import load_dotenv
 import asyncpg
 
+# Optional: libuv-based event loop for the network-bound async work
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +36,9 @@ logger = logging.getLogger("update_refids")
 # Load environment variables
 load_dotenv()
 
+# Rows fetched per round-trip when streaming frames and chunks
+CURSOR_PREFETCH = 1000
+
 # Database connection parameters
 DB_HOST = os.getenv('SUPABASE_DB_HOST', 'aws-0-us-east-1.pooler.supabase.com')
 DB_PORT = os.getenv('SUPABASE_DB_PORT', '5432')
@@ -63,17 +73,18 @@ async def get_frames_data(conn):
         Dictionary mapping frame_id to (folder_name, file_name)
     """
     try:
-        frames = await conn.fetch("""
-            SELECT frame_id, folder_name, file_name
-            FROM content.frames
-        """)
-        
+        # Stream the rows with a server-side cursor (which needs a transaction)
+        # rather than holding the full result next to the dictionary
         frames_data = {}
-        for frame in frames:
-            frames_data[frame['frame_id']] = (
-                frame['folder_name'],
-                frame['file_name']
-            )
+        async with conn.transaction():
+            async for frame in conn.cursor("""
+                SELECT frame_id, folder_name, file_name
+                FROM content.frames
+            """, prefetch=CURSOR_PREFETCH):
+                frames_data[frame['frame_id']] = (
+                    frame['folder_name'],
+                    frame['file_name']
+                )
         
         logger.info(f"Retrieved data for {len(frames_data)} frames")
         return frames_data
@@ -92,14 +103,14 @@ async def get_chunks_data(conn):
         Dictionary mapping chunk_id to frame_id
     """
     try:
-        chunks = await conn.fetch("""
-            SELECT chunk_id, frame_id
-            FROM metadata.frame_details_chunks
-        """)
-        
+        # Stream the rows with a server-side cursor (which needs a transaction)
         chunks_data = {}
-        for chunk in chunks:
-            chunks_data[chunk['chunk_id']] = chunk['frame_id']
+        async with conn.transaction():
+            async for chunk in conn.cursor("""
+                SELECT chunk_id, frame_id
+                FROM metadata.frame_details_chunks
+            """, prefetch=CURSOR_PREFETCH):
+                chunks_data[chunk['chunk_id']] = chunk['frame_id']
         
         logger.info(f"Retrieved data for {len(chunks_data)} chunks")
         return chunks_data
@@ -107,6 +118,30 @@ async def get_chunks_data(conn):
         logger.error(f"Error getting chunks data: {str(e)}")
         raise
 
+async def set_reference_ids(conn, table, key_column, updates):
+    """
+    Set reference_id for many rows with a single UPDATE joined against the
+    unnested (reference_id, key) pairs, instead of one statement per row.
+    Rows whose reference_id is already correct are left untouched.
+    
+    Args:
+        conn: Database connection
+        table: Qualified name of the table to update
+        key_column: Text column identifying the rows
+        updates: List of (new_reference_id, key) tuples
+        
+    Returns:
+        Number of updated rows
+    """
+    result = await conn.execute(f"""
+        UPDATE {table} t
+        SET reference_id = data.reference_id
+        FROM UNNEST($1::text[], $2::text[]) AS data(reference_id, key)
+        WHERE t.{key_column} = data.key
+        AND t.reference_id IS DISTINCT FROM data.reference_id
+    """, [reference_id for reference_id, _ in updates], [str(key) for _, key in updates])
+    return int(result.split()[-1])
+
 async def update_frame_reference_ids(conn, frames_data):
     """
     Update reference IDs for frames to format 'foldername/filename'.
@@ -128,13 +163,7 @@ async def update_frame_reference_ids(conn, frames_data):
             updates.append((new_reference_id, frame_id))
         
         async with conn.transaction():
-            result = await conn.executemany("""
-                UPDATE metadata.frame_details_full
-                SET reference_id = $1
-                WHERE frame_id = $2
-            """, updates)
-            
-            frame_count = len(updates)
+            frame_count = await set_reference_ids(conn, "metadata.frame_details_full", "frame_id", updates)
             logger.info(f"Updated {frame_count} reference IDs in metadata.frame_details_full")
             total_updated += frame_count
             
@@ -143,13 +172,8 @@ async def update_frame_reference_ids(conn, frames_data):
             await conn.execute("SELECT reference_id FROM content.frames LIMIT 1")
             # If we get here, the column exists
             async with conn.transaction():
-                result = await conn.executemany("""
-                    UPDATE content.frames
-                    SET reference_id = $1
-                    WHERE frame_id = $2
-                """, updates)
-                
-                logger.info(f"Updated {frame_count} reference IDs in content.frames")
+                content_count = await set_reference_ids(conn, "content.frames", "frame_id", updates)
+                logger.info(f"Updated {content_count} reference IDs in content.frames")
         except Exception as e:
             # Column might not exist
             logger.info("No reference_id column in content.frames, skipping")
@@ -201,26 +225,18 @@ async def update_chunk_reference_ids(conn, chunks_data, frames_data):
         
         # Update metadata.frame_details_chunks
         async with conn.transaction():
-            await conn.executemany("""
-                UPDATE metadata.frame_details_chunks
-                SET reference_id = $1
-                WHERE chunk_id = $2
-            """, chunk_updates)
-            
-            logger.info(f"Updated {len(chunk_updates)} reference IDs in metadata.frame_details_chunks")
-            total_updated += len(chunk_updates)
+            chunk_count = await set_reference_ids(conn, "metadata.frame_details_chunks", "chunk_id", chunk_updates)
+            logger.info(f"Updated {chunk_count} reference IDs in metadata.frame_details_chunks")
+            total_updated += chunk_count
         
         # Update embeddings.multimodal_embeddings_chunks
         try:
             async with conn.transaction():
-                await conn.executemany("""
-                    UPDATE embeddings.multimodal_embeddings_chunks
-                    SET reference_id = $1
-                    WHERE chunk_id = $2
-                """, chunk_updates)
-                
-                logger.info(f"Updated {len(chunk_updates)} reference IDs in embeddings.multimodal_embeddings_chunks")
-                total_updated += len(chunk_updates)
+                embedding_count = await set_reference_ids(
+                    conn, "embeddings.multimodal_embeddings_chunks", "chunk_id", chunk_updates
+                )
+                logger.info(f"Updated {embedding_count} reference IDs in embeddings.multimodal_embeddings_chunks")
+                total_updated += embedding_count
         except Exception as e:
             logger.error(f"Error updating embeddings: {str(e)}")
             # Continue with other updates
@@ -318,4 +334,7 @@ async def main():
         logger.info("PostgreSQL connection pool closed")
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    
     asyncio.run(main()) 
\ No newline at end of file